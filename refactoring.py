@@ -1,216 +1,468 @@
+import argparse
+import asyncio
+from collections.abc import AsyncIterator
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import as_completed
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
+from datetime import datetime
+import hashlib
+import io
+import json
 import os
+from pathlib import Path
 from pyexpat import model
-import re
 import shutil
-import argparse
 import subprocess
-from pathlib import Path
-from datetime import datetime
+import tarfile
+import tempfile
 from unittest import result
 
-REFACTORING = 'rename'
-PATH = 'src/pluggy'
+import httpx
+
+
+REFACTORING = "rename"
+PATH = "src/pluggy"
 ITERATIONS = 10
-GEMINI3 = 'gemini-3-pro-preview'
-GEMINI2 = 'gemini-2.5-flash'
-LLAMA = 'llama-3.3-70b-versatile'
-MISTRAL = 'mistral-large-2512'
-CODESTRAL = 'codestral-2501'
-MODEL_OLLAMA = 'devstral-2_123b-cloud'
+MAX_CONCURRENT_REQUESTS = 5
+USE_BATCH_API = False
+BATCH_POLL_MAX_DELAY = 60
+USE_PROMPT_CACHE = False
+PROMPT_CACHE_TTL = "3600s"
+WRITE_WORKERS = (os.cpu_count() or 1) * 4
+CODE_ARCHIVE_NAME = "code.tar.gz"
+GEMINI3 = "gemini-3-pro-preview"
+GEMINI2 = "gemini-2.5-flash"
+LLAMA = "llama-3.3-70b-versatile"
+MISTRAL = "mistral-large-2512"
+CODESTRAL = "codestral-2501"
+MODEL_OLLAMA = "devstral-2_123b-cloud"
 MODEL_GROQ = LLAMA
 MODEL_GEMINI = GEMINI3
 MODEL_MISTRAL = CODESTRAL
-GROQ_API_KEY = os.environ.get('GROQ_API_KEY')
-GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY')
-MISTRAL_API_KEY = os.environ.get('MISTRAL_API_KEY')
+GROQ_API_KEY = os.environ.get("GROQ_API_KEY")
+GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY")
+MISTRAL_API_KEY = os.environ.get("MISTRAL_API_KEY")
 LLM_API_KEY = GEMINI_API_KEY
 client = None
 MODEL = None
+PROVIDER_BASE_URL = None
+
+# main() öffnet einen gemeinsamen Connection-Pool für alle Iterationen, damit
+# Keep-Alive-Verbindungen (und damit der TLS-Handshake) zwischen den Anfragen
+# wiederverwendet werden.
+HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+HTTP_TIMEOUT = 120
 
 if LLM_API_KEY == MISTRAL_API_KEY:
     from mistralai import Mistral
+
     MODEL = MODEL_MISTRAL
-    try:
-        client = Mistral(api_key=LLM_API_KEY)
-        print("Mistral API Key aus Umgebungsvariable geladen")
-    except Exception as e:
-        print(f"Fehler beim Laden des API-Keys: {e}")
-        exit(1)    
+    PROVIDER_BASE_URL = "https://api.mistral.ai"
 elif LLM_API_KEY == GEMINI_API_KEY:
     from google import genai
+    from google.genai import types
+
     MODEL = MODEL_GEMINI
     try:
-        client = genai.Client(api_key=LLM_API_KEY)
+        client = genai.Client(
+            api_key=LLM_API_KEY,
+            http_options=types.HttpOptions(
+                timeout=HTTP_TIMEOUT * 1000,
+                async_client_args={"limits": HTTP_LIMITS},
+            ),
+        )
         print("Gemini API Key aus Umgebungsvariable geladen")
     except Exception as e:
         print(f"Fehler beim Laden des API-Keys: {e}")
         exit(1)
 elif LLM_API_KEY == GROQ_API_KEY:
-    from groq import Groq
+    from groq import AsyncGroq
+
     MODEL = MODEL_GROQ
+    PROVIDER_BASE_URL = "https://api.groq.com"
+
+
+def connect_client(http_client: httpx.AsyncClient) -> None:
+    """Erstellt den Mistral- bzw. Groq-Client auf dem Connection-Pool von main()."""
+    global client
     try:
-        client = Groq(api_key=LLM_API_KEY)
-        print("Groq API Key aus Umgebungsvariable geladen")
+        if LLM_API_KEY == MISTRAL_API_KEY:
+            client = Mistral(api_key=LLM_API_KEY, async_client=http_client)
+            print("Mistral API Key aus Umgebungsvariable geladen")
+        elif LLM_API_KEY == GEMINI_API_KEY:
+            # Gemini verwendet einen eigenen httpx-Client, der Client steht bereits.
+            return
+        elif LLM_API_KEY == GROQ_API_KEY:
+            client = AsyncGroq(api_key=LLM_API_KEY, http_client=http_client)
+            print("Groq API Key aus Umgebungsvariable geladen")
     except Exception as e:
         print(f"Fehler beim Laden des API-Keys: {e}")
         exit(1)
 
 
-
-
 parser = argparse.ArgumentParser(description="Projektpfad angeben")
 parser.add_argument("--project-path", type=str, default=PATH, help="Pfad des Projekts")
 args = parser.parse_args()
 
 PROJECT_DIR = Path(args.project_path)
-PROMPT_TEMPLATE = Path(f"{REFACTORING}.txt").read_text(encoding='utf-8')
+PROMPT_TEMPLATE = Path(f"{REFACTORING}.txt").read_text(encoding="utf-8")
 RESULTS_DIR = Path(REFACTORING + "_results2_" + MODEL)
 RESULTS_DIR.mkdir(exist_ok=True)
 
-def get_project_structure(project_dir: Path) -> str:
-    """Erstellt eine Übersicht der Projektstruktur."""
+SKIP_DIRS = frozenset({"__pycache__", "tests", "pathlib2.egg-info"})
+SKIP_FILES = frozenset({"conftest.py"})
+
+
+def is_test_file(name: str) -> bool:
+    return name.startswith("test_") or name.endswith("_test.py") or name in SKIP_FILES
+
+
+CODE_CACHE_PATH = Path(".refac_cache.json")
+
+
+def load_code_cache() -> dict[str, list]:
+    """Lädt den Cache {Pfad: [mtime_ns, Größe, Inhalt]} eines früheren Laufs."""
+    try:
+        return json.loads(CODE_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_code_cache(code_cache: dict[str, list]) -> None:
+    CODE_CACHE_PATH.write_text(json.dumps(code_cache), encoding="utf-8")
+
+
+def _read_source(
+    file_path: Path, stat: os.stat_result, code_cache: dict[str, list] | None
+) -> str:
+    """Liest eine Datei, falls mtime oder Größe vom Cache-Eintrag abweichen."""
+    key = str(file_path)
+    if code_cache is not None:
+        cached = code_cache.get(key)
+        if (
+            cached is not None
+            and cached[0] == stat.st_mtime_ns
+            and cached[1] == stat.st_size
+        ):
+            return cached[2]
+    content = file_path.read_bytes().decode("utf-8", "replace")
+    if code_cache is not None:
+        code_cache[key] = [stat.st_mtime_ns, stat.st_size, content]
+    return content
+
+
+def scan_project(
+    project_dir: Path, code_cache: dict[str, list] | None = None
+) -> tuple[str, str]:
+    """Erstellt Projektstruktur und Code-Textblock in einem Verzeichnisdurchlauf."""
     structure = []
-    for root, dirs, files in os.walk(project_dir):
-        dirs[:] = [d for d in dirs if not d.startswith('.') and d not in {'__pycache__', 'tests', 'pathlib2.egg-info'}]
-        level = root.replace(str(project_dir), '').count(os.sep)
-        indent = ' ' * 2 * level
-        structure.append(f'{indent}{os.path.basename(root)}/')
-        subindent = ' ' * 2 * (level + 1)
-        for file in files:
-            if file.endswith('.py'):
-                structure.append(f'{subindent}{file}')
-    return '\n'.join(structure)
-
-def get_all_python_files(project_dir: Path) -> str:
-    """Liest alle Python-Dateien ein und liefert einen großen Textblock."""
-    code_block = ""
-    for root, dirs, files in os.walk(project_dir):
-        dirs[:] = [d for d in dirs if not d.startswith('.') and d not in {'__pycache__', 'tests', 'pathlib2.egg-info'}]
-        for file in files:
-            if "test" in file:
+    code_parts = []
+    stack = [(str(project_dir), 0)]
+    while stack:
+        root, level = stack.pop()
+        try:
+            with os.scandir(root) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        structure.append(f"{'  ' * level}{os.path.basename(root)}/")
+        subindent = "  " * (level + 1)
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir():
+                if (
+                    not entry.name.startswith(".")
+                    and entry.name not in SKIP_DIRS
+                    and not entry.is_symlink()
+                ):
+                    subdirs.append(entry.path)
                 continue
-            if file.endswith('.py'):
-                file_path = Path(root) / file
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    relative_path = file_path.relative_to(project_dir)
-                    code_block += f"\n\nFile `{relative_path}`:\n```python\n"
-                    code_block += content + "```\n"
-                except Exception as e:
-                    print(f"Fehler beim Lesen von {file_path}: {e}")
-    return code_block
+            if not entry.name.endswith(".py"):
+                continue
+            structure.append(f"{subindent}{entry.name}")
+            if is_test_file(entry.name):
+                continue
+            file_path = Path(entry.path)
+            try:
+                content = _read_source(file_path, entry.stat(), code_cache)
+                relative_path = file_path.relative_to(project_dir)
+                code_parts.append(
+                    f"\n\nFile `{relative_path}`:\n```python\n{content}```\n"
+                )
+            except Exception as e:
+                print(f"Fehler beim Lesen von {file_path}: {e}")
+
+        # Umgekehrt auf den Stack legen, damit die Reihenfolge der von os.walk
+        # entspricht.
+        stack.extend((path, level + 1) for path in reversed(subdirs))
+    return "\n".join(structure), "".join(code_parts)
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    while pos < len(text) and text[pos].isspace():
+        pos += 1
+    return pos
+
+
+def iter_file_blocks(text: str) -> Iterator[tuple[str, str, int]]:
+    """Liefert (Dateiname, Code, Endposition) je vollständigem Datei-Block.
+
+    Ein Block hat die Form "File `x`: ```python ...```".
+
+    Linearer Scanner mit str.find statt eines backtrackenden Regex; unvollständige
+    Blöcke am Ende von text werden nicht geliefert.
+    """
+    pos = 0
+    while (start := text.find("File", pos)) >= 0:
+        pos = start + len("File")
+        name_start = _skip_whitespace(text, pos)
+        if name_start == pos or not text.startswith("`", name_start):
+            continue
+        name_end = text.find("`", name_start + 1)
+        if name_end < 0:
+            return
+        if name_end == name_start + 1 or not text.startswith(":", name_end + 1):
+            continue
+        fence = _skip_whitespace(text, name_end + 2)
+        if not text.startswith("```python", fence):
+            continue
+        code_start = fence + len("```python")
+        code_end = text.find("```", code_start)
+        if code_end < 0:
+            return
+        pos = code_end + len("```")
+        yield text[name_start + 1 : name_end], text[code_start:code_end].strip(), pos
+
 
 def parse_ai_response(response_text: str) -> dict:
     """Parst die AI-Antwort und extrahiert Dateinamen und Code."""
-    files = {}
-    pattern = r"File\s+`([^`]+)`:\s*```python\s*(.*?)\s*```"
-    matches = re.findall(pattern, response_text, re.DOTALL)
-    for filename, code in matches:
-        files[filename] = code.strip()
-    return files
+    return {name: code for name, code, _ in iter_file_blocks(response_text)}
+
+
+def _hardlink_copy(src: str, dst: str) -> None:
+    """Legt einen Hardlink an; kopiert nur, wenn das nicht möglich ist."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
 
 def backup_project(project_dir: Path, backup_dir: Path) -> None:
     """Erstellt ein Backup des Projekts."""
     if backup_dir.exists():
         shutil.rmtree(backup_dir)
     shutil.copytree(
-        project_dir, backup_dir, 
-        ignore=shutil.ignore_patterns('__pycache__', '*.pyc', '.git', 'test', 'tests', 'pathlib2.egg-info')
+        project_dir,
+        backup_dir,
+        ignore=shutil.ignore_patterns(
+            "__pycache__", "*.pyc", ".git", "test", "tests", "pathlib2.egg-info"
+        ),
+        copy_function=_hardlink_copy,
     )
 
-def restore_project(backup_dir: Path, project_dir: Path) -> None:
-    """Stellt das Projekt aus dem Backup wieder her"""
+
+def _restore_file(src: str, dst: str) -> None:
+    """Ersetzt dst durch einen Hardlink auf src, sofern es nicht schon derselbe ist."""
+    try:
+        if os.path.samefile(src, dst):
+            return
+    except FileNotFoundError:
+        pass
+    # Erst daneben anlegen und dann ersetzen, damit dst nie fehlt.
+    tmp_path = os.path.join(os.path.dirname(dst), f".{os.path.basename(dst)}.restore")
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(tmp_path)
+    _hardlink_copy(src, tmp_path)
+    os.replace(tmp_path, dst)
+
+
+def restore_project(
+    backup_dir: Path, project_dir: Path, written: Iterable[Path] = ()
+) -> None:
+    """Stellt das Projekt aus dem Backup wieder her.
+
+    Die Dateien werden über den bestehenden Baum gelegt; .git, Tests und alles
+    andere, was nicht im Backup liegt, bleibt erhalten. Von apply_changes neu
+    angelegte Dateien (written) werden entfernt.
+    """
     backup_dir = Path(backup_dir).resolve()
     project_dir = Path(project_dir).resolve()
 
     if not backup_dir.exists():
         raise FileNotFoundError(f"Backup-Verzeichnis nicht gefunden: {backup_dir}")
 
-    project_dir.mkdir(parents=True, exist_ok=True)
-    shutil.copytree(backup_dir, project_dir, dirs_exist_ok=True)
+    for file_path in written:
+        if not (backup_dir / file_path.relative_to(project_dir)).exists():
+            file_path.unlink(missing_ok=True)
+    shutil.copytree(
+        backup_dir, project_dir, dirs_exist_ok=True, copy_function=_restore_file
+    )
+
 
-def apply_changes(project_dir: Path | str, files: dict[str, str]) -> None:
-    """Wendet die Änderungen auf die Dateien an, ignoriert jedoch Dateien im 'tests'-Ordner."""
+def _write_file(file_path: Path, content: str) -> None:
+    # Über eine temporäre Datei ersetzen statt in-place zu schreiben: Projekt und
+    # Backup teilen sich per Hardlink dieselben Inodes.
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+    tmp_path.write_text(content, encoding="utf-8")
+    os.replace(tmp_path, file_path)
+
+
+def apply_changes(project_dir: Path | str, files: dict[str, str]) -> list[Path]:
+    """Wendet die Änderungen auf die Dateien an, ignoriert aber den 'tests'-Ordner.
+
+    Gibt die geschriebenen Pfade zurück.
+    """
     project_dir = Path(project_dir).resolve()
+    # Reiner String-Vergleich statt resolve() pro Datei: das Projekt wird per copytree
+    # (ohne Symlinks) wiederhergestellt, ".." und absolute Pfade fängt normpath ab.
+    root = str(project_dir)
+    root_prefix = os.path.join(root, "")
 
+    writes = {}
     for filename, code in files.items():
         file_rel = Path(filename)
 
-        if any(part == 'tests' for part in file_rel.parts):
+        if any(part == "tests" for part in file_rel.parts):
             continue
 
-        file_path = (project_dir / file_rel).resolve()
-        try:
-            file_path.relative_to(project_dir)
-        except ValueError:
+        candidate = os.path.normpath(os.path.join(root, filename))
+        if not candidate.startswith(root_prefix):
             print(f" {filename} liegt außerhalb von {project_dir}, übersprungen")
             continue
 
-        try:
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(code, encoding='utf-8')
-            print(f" {filename} aktualisiert")
-        except Exception as e:
-            print(f" Fehler beim Schreiben von {filename}: {e}")
+        writes[Path(candidate)] = (filename, code)
+
+    with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+        futures = {
+            executor.submit(_write_file, file_path, code): filename
+            for file_path, (filename, code) in writes.items()
+        }
+        for future in as_completed(futures):
+            filename = futures[future]
+            try:
+                future.result()
+                print(f" {filename} aktualisiert")
+            except Exception as e:
+                print(f" Fehler beim Schreiben von {filename}: {e}")
+    # Auch bei Fehlern alle Ziele melden, eine halb geschriebene Datei muss weg.
+    return list(writes)
+
 
 def run_pytest():
     """Führt pytest aus und gibt das Ergebnis zurück."""
+    # Eigener Prozess pro Lauf: pytest hängt selbst von pluggy ab und muss die in
+    # dieser Iteration geschriebene Fassung laden, nicht die beim Start importierte.
     try:
         result = subprocess.run(
-            ['pytest'], 
-            capture_output=True, 
-            text=True, 
+            ["pytest"],
+            check=False,
+            capture_output=True,
+            text=True,
         )
         return {
-            'success': result.returncode == 0,
-            'stdout': result.stdout,
-            'stderr': result.stderr,
-            'returncode': result.returncode
+            "success": result.returncode == 0,
+            "stdout": result.stdout,
+            "stderr": result.stderr,
+            "returncode": result.returncode,
         }
     except Exception as e:
-        return {'success': False, 'stdout': '', 'stderr': str(e), 'returncode': -1}
+        return {"success": False, "stdout": "", "stderr": str(e), "returncode": -1}
 
-def save_results(iteration: int, result_dir: Path, files: dict, test_result: dict, response_text: str) -> None:
-    """Speichert die Ergebnisse einer Iteration."""
-    result_dir.mkdir(parents=True, exist_ok=True)
-    code_dir = result_dir / "code"
-    code_dir.mkdir(exist_ok=True)
-    for filename, code in files.items():
-        file_path = code_dir / filename
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(code)
 
-    if(test_result['success']):
+def files_fingerprint(files: dict[str, str]) -> str:
+    """Liefert einen Hash über alle Dateinamen und Inhalte einer AI-Antwort."""
+    h = hashlib.blake2b(digest_size=16)
+    for filename in sorted(files):
+        h.update(filename.encode("utf-8"))
+        h.update(b"\0")
+        h.update(files[filename].encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+_STDOUT_SEPARATOR = b"\n" + b"=" * 60 + b"\nSTDOUT:\n"
+_STDERR_SEPARATOR = b"\n" + b"=" * 60 + b"\nSTDERR:\n"
+
+
+def _write_chunks(path: Path, chunks: list[bytes]) -> None:
+    """Schreibt bereits kodierte Teile mit einem writev-Aufruf (falls verfügbar)."""
+    if not hasattr(os, "writev"):
+        path.write_bytes(b"".join(chunks))
+        return
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        written = os.writev(fd, chunks)
+        if written < sum(map(len, chunks)):
+            rest = b"".join(chunks)[written:]
+            while rest:
+                rest = rest[os.write(fd, rest) :]
+    finally:
+        os.close(fd)
+
+
+def save_results(
+    iteration: int, result_dir: Path, files: dict, test_result: dict
+) -> None:
+    """Speichert die Ergebnisse einer Iteration.
+
+    ai_response.txt schreibt bereits generate() bzw. mistral_batch_generate().
+    """
+    result_dir.mkdir(parents=True, exist_ok=True)
+    # Ein einzelnes Archiv statt eines code/-Baums mit einer Datei pro Modul.
+    with tarfile.open(result_dir / CODE_ARCHIVE_NAME, "w:gz") as tar:
+        for filename, code in files.items():
+            data = code.encode("utf-8")
+            info = tarfile.TarInfo(filename)
+            info.size = len(data)
+            info.mtime = int(datetime.now().timestamp())
+            tar.addfile(info, io.BytesIO(data))
+
+    if test_result["success"]:
         status = "success_"
     else:
         status = "failure_"
-    with open(result_dir / f"{status}test_result.txt", 'w', encoding='utf-8') as f:
-        f.write(f"Iteration {iteration}\nTimestamp: {datetime.now().isoformat()}\n")
-        f.write(f"Success: {test_result['success']}\n")
-        f.write("\n" + "="*60 + "\nSTDOUT:\n" + test_result['stdout'])
-        f.write("\n" + "="*60 + "\nSTDERR:\n" + test_result['stderr'])
+    _write_chunks(
+        result_dir / f"{status}test_result.txt",
+        [
+            f"Iteration {iteration}\n".encode(),
+            f"Timestamp: {datetime.now().isoformat()}\n".encode(),
+            f"Success: {test_result['success']}\n".encode(),
+            _STDOUT_SEPARATOR,
+            test_result["stdout"].encode("utf-8"),
+            _STDERR_SEPARATOR,
+            test_result["stderr"].encode("utf-8"),
+        ],
+    )
 
-    with open(result_dir / "ai_response.txt", 'w', encoding='utf-8') as f:
-        f.write(response_text)
 
 def write_summary(text: str) -> None:
     with open(RESULTS_DIR / f"{MODEL}_summary_results.txt", "a", encoding="utf-8") as f:
         f.write(text)
 
+
 def _usage_to_dict(usage) -> dict | None:
     if usage is None:
         return None
     if isinstance(usage, dict):
         return usage
     data = {}
-    for attr in ("prompt_tokens", "completion_tokens", "total_tokens",
-                 "prompt_token_count", "candidates_token_count", "total_token_count"):
+    for attr in (
+        "prompt_tokens",
+        "completion_tokens",
+        "total_tokens",
+        "prompt_token_count",
+        "candidates_token_count",
+        "total_token_count",
+    ):
         if hasattr(usage, attr):
             data[attr] = getattr(usage, attr)
     return data or None
 
+
 def format_token_usage(usage: dict | None) -> str:
     if not usage:
         return "Tokens: n/a"
@@ -228,38 +480,44 @@ def format_token_usage(usage: dict | None) -> str:
         return "Tokens: n/a"
     return "Tokens: " + ", ".join(parts)
 
-def groq_generate(final_prompt: str) -> tuple[str, dict | None]:
-    resp = client.chat.completions.create(
-        model=MODEL,
-        content=final_prompt
-    )
-    usage = _usage_to_dict(getattr(resp, "usage", None))
-    return resp.choices[0].message.content, usage
 
-def gemini_generate(final_prompt: str) -> tuple[str, dict | None]:
-    """Fragt Gemini (Text Completions) an und gibt den Text-Content zurück."""
-    response = client.models.generate_content(
+async def groq_stream(final_prompt: str) -> AsyncIterator[tuple[str, dict | None]]:
+    stream = await client.chat.completions.create(
         model=MODEL,
-        contents=final_prompt
+        messages=[
+            {
+                "content": final_prompt,
+                "role": "user",
+            },
+        ],
+        stream=True,
     )
+    async for chunk in stream:
+        text = chunk.choices[0].delta.content if chunk.choices else None
+        x_groq = getattr(chunk, "x_groq", None)
+        yield text or "", _usage_to_dict(getattr(x_groq, "usage", None))
 
-    response_text = getattr(response, "text", None)
-    if not response_text and hasattr(response, "candidates"):
-        parts = [p.text for c in response.candidates for p in c.content.parts if hasattr(p, "text")]
-        response_text = "\n".join(parts)
-    
-    if not response_text:
-        raise ValueError("Leere Antwort erhalten")
 
-    usage = None
-    usage_meta = getattr(response, "usage_metadata", None)
-    if usage_meta is not None:
-        usage = _usage_to_dict(usage_meta)
+async def gemini_stream(
+    final_prompt: str, cached_content: str | None = None
+) -> AsyncIterator[tuple[str, dict | None]]:
+    """Fragt Gemini (Text Completions) an und liefert den Text-Content stückweise."""
+    stream = await client.aio.models.generate_content_stream(
+        model=MODEL,
+        contents=final_prompt,
+        config=types.GenerateContentConfig(cached_content=cached_content)
+        if cached_content
+        else None,
+    )
+    async for chunk in stream:
+        yield (
+            getattr(chunk, "text", None) or "",
+            _usage_to_dict(getattr(chunk, "usage_metadata", None)),
+        )
 
-    return response_text, usage
 
-def mistral_generate(prompt: str) -> tuple[str, dict | None]:
-    res = client.chat.complete(
+async def mistral_stream(prompt: str) -> AsyncIterator[tuple[str, dict | None]]:
+    stream = await client.chat.stream_async(
         model=MODEL,
         messages=[
             {
@@ -268,65 +526,262 @@ def mistral_generate(prompt: str) -> tuple[str, dict | None]:
             },
         ],
         temperature=0.2,
-        stream=False
     )
-    usage = _usage_to_dict(getattr(res, "usage", None))
-    return res.choices[0].message.content, usage
+    async for event in stream:
+        text = event.data.choices[0].delta.content if event.data.choices else None
+        yield text or "", _usage_to_dict(getattr(event.data, "usage", None))
 
-def main():
-    YOUR_PROMPT = PROMPT_TEMPLATE
-    print(f"{'='*60}\nStarte Refactoring-Experiment\n{'='*60}\n")
 
-    backup_dir = Path("backup_original")
-    backup_project(PROJECT_DIR, backup_dir)
+async def mistral_batch_generate(
+    prompts: list[str], response_paths: list[Path]
+) -> list[tuple[dict, dict | None] | Exception]:
+    """Schickt alle Prompts als einen Mistral-Batch-Job.
 
-    project_structure = get_project_structure(PROJECT_DIR)
-    code_block = get_all_python_files(PROJECT_DIR)
-
-    final_prompt = f"{YOUR_PROMPT}\n\nStructure:\n{project_structure}\n\nCode:\n{code_block}"
-    successful_iterations = 0
-    
-    with open(RESULTS_DIR / "full_prompt.txt", "w", encoding="utf-8") as f:
-        f.write(final_prompt)
+    Liefert die geparsten Antworten in Prompt-Reihenfolge.
+    """
+    lines = [
+        json.dumps(
+            {
+                "custom_id": f"iter_{i}",
+                "body": {
+                    "messages": [{"content": prompt, "role": "user"}],
+                    "temperature": 0.2,
+                },
+            }
+        )
+        for i, prompt in enumerate(prompts)
+    ]
+    batch_file = await client.files.upload_async(
+        file={"file_name": "batch.jsonl", "content": "\n".join(lines).encode("utf-8")},
+        purpose="batch",
+    )
+    job = await client.batch.jobs.create_async(
+        input_files=[batch_file.id],
+        model=MODEL,
+        endpoint="/v1/chat/completions",
+    )
 
-    for i in range(1, ITERATIONS   +1):
-        print(f"\nITERATION {i}/{ITERATIONS}")
-        restore_project(backup_dir, PROJECT_DIR)
+    delay = 1
+    while job.status in ("QUEUED", "RUNNING"):
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, BATCH_POLL_MAX_DELAY)
+        job = await client.batch.jobs.get_async(job_id=job.id)
+    if job.status != "SUCCESS":
+        raise RuntimeError(f"Batch-Job {job.id} beendet mit Status {job.status}")
+
+    output = await client.files.download_async(file_id=job.output_file)
+    results: dict[str, tuple[str, dict | None]] = {}
+    for line in (await output.aread()).decode("utf-8").splitlines():
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        body = entry["response"]["body"]
+        results[entry["custom_id"]] = (
+            body["choices"][0]["message"]["content"],
+            _usage_to_dict(body.get("usage")),
+        )
 
-        try:
-            usage = None
-            if LLM_API_KEY == MISTRAL_API_KEY:
-                response_text, usage = mistral_generate(final_prompt)
-            elif LLM_API_KEY == GEMINI_API_KEY:
-                response_text, usage = gemini_generate(final_prompt)
-            elif LLM_API_KEY == GROQ_API_KEY:
-                response_text, usage = groq_generate(final_prompt)
+    responses: list[tuple[dict, dict | None] | Exception] = []
+    for i, response_path in enumerate(response_paths):
+        if f"iter_{i}" not in results:
+            responses.append(ValueError(f"Keine Batch-Antwort für Iteration {i + 1}"))
+            continue
+        response_text, usage = results[f"iter_{i}"]
+        response_path.parent.mkdir(parents=True, exist_ok=True)
+        response_path.write_text(response_text, encoding="utf-8")
+        responses.append((parse_ai_response(response_text), usage))
+    return responses
 
 
-            files = parse_ai_response(response_text)
-            if not files:
+async def create_gemini_prompt_cache(context: str) -> str:
+    """Legt den für alle Iterationen identischen Kontext als Gemini-Context-Cache an."""
+    cache = await client.aio.caches.create(
+        model=MODEL,
+        config=types.CreateCachedContentConfig(
+            contents=[context], ttl=PROMPT_CACHE_TTL
+        ),
+    )
+    return cache.name
+
+
+async def generate(
+    final_prompt: str,
+    semaphore: asyncio.Semaphore,
+    response_path: Path,
+    cached_content: str | None = None,
+) -> tuple[dict, dict | None]:
+    """Streamt die Antwort des konfigurierten LLMs und parst sie dabei.
+
+    Die Dateien werden extrahiert, sobald ihr Code-Block vollständig empfangen wurde;
+    die Rohantwort wird nach dem Stream nach response_path geschrieben.
+    """
+    async with semaphore:
+        if LLM_API_KEY == MISTRAL_API_KEY:
+            chunks = mistral_stream(final_prompt)
+        elif LLM_API_KEY == GEMINI_API_KEY:
+            chunks = gemini_stream(final_prompt, cached_content)
+        elif LLM_API_KEY == GROQ_API_KEY:
+            chunks = groq_stream(final_prompt)
+        else:
+            raise ValueError("Kein LLM-Client konfiguriert")
+
+        files = {}
+        usage = None
+        parts = []
+        buffer = ""
+        scanned = 0
+        async for text, chunk_usage in chunks:
+            usage = chunk_usage or usage
+            if not text:
                 continue
+            parts.append(text)
+            buffer += text
+            # Ein Block wird erst durch ein neues ``` vollständig; ohne diese Prüfung
+            # würde jeder Chunk den offenen Block erneut von vorne durchsuchen.
+            if "```" not in buffer[max(scanned - 2, 0) :]:
+                scanned = len(buffer)
+                continue
+            consumed = 0
+            for filename, code, consumed in iter_file_blocks(buffer):
+                files[filename] = code
+            buffer = buffer[consumed:]
+            scanned = len(buffer)
+
+        if not parts:
+            raise ValueError("Leere Antwort erhalten")
+        await asyncio.to_thread(_write_file, response_path, "".join(parts))
+        return files, usage
+
+
+async def prewarm_connections(http_client: httpx.AsyncClient) -> None:
+    """Baut die TLS-Verbindungen im gemeinsamen Pool vorab auf.
+
+    So zahlen die ersten Anfragen keinen Handshake.
+    """
+    # Gemini verwendet einen eigenen httpx-Client, dort gibt es nichts vorzuwärmen.
+    if PROVIDER_BASE_URL is None:
+        return
+    results = await asyncio.gather(
+        *(
+            http_client.head(PROVIDER_BASE_URL)
+            for _ in range(min(MAX_CONCURRENT_REQUESTS, ITERATIONS))
+        ),
+        return_exceptions=True,
+    )
+    errors = [r for r in results if isinstance(r, Exception)]
+    if errors:
+        print(
+            f"Verbindung zu {PROVIDER_BASE_URL} konnte nicht vorgewärmt werden: "
+            f"{errors[0]}"
+        )
+
+
+async def main():
+    YOUR_PROMPT = PROMPT_TEMPLATE
+    print(f"{'=' * 60}\nStarte Refactoring-Experiment\n{'=' * 60}\n")
 
-            apply_changes(PROJECT_DIR, files)
-            test_result = run_pytest()
-            token_info = format_token_usage(usage)
+    code_cache = load_code_cache()
+    project_structure, code_block = scan_project(PROJECT_DIR, code_cache)
+    save_code_cache(code_cache)
 
-            if test_result['success']:
-                successful_iterations += 1
-                write_summary(f"\nIteration {i} erfolgreich. {token_info}")
-                print(" Tests bestanden.")
-            else:
-                write_summary(f"\nIteration {i} fehlgeschlagen. {token_info}")
-                print(" Tests fehlgeschlagen.")
+    context = f"Structure:\n{project_structure}\n\nCode:\n{code_block}"
+    final_prompt = f"{YOUR_PROMPT}\n\n{context}"
+    successful_iterations = 0
+    result_cache: dict[str, dict] = {}
+
+    await asyncio.to_thread(
+        (RESULTS_DIR / "full_prompt.txt").write_text, final_prompt, encoding="utf-8"
+    )
 
-            save_results(i, RESULTS_DIR / f"iteration_{i:02d}", files, test_result, response_text)
+    # Die LLM-Anfragen sind rein netzwerkgebunden und laufen daher parallel;
+    # restore/apply/pytest verändern das Projekt und bleiben sequentiell.
+    http_client = httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+    async with http_client:
+        connect_client(http_client)
+        await prewarm_connections(http_client)
+        response_paths = [
+            RESULTS_DIR / f"iteration_{i:02d}" / "ai_response.txt"
+            for i in range(1, ITERATIONS + 1)
+        ]
+        if USE_BATCH_API and LLM_API_KEY == MISTRAL_API_KEY:
+            responses = await mistral_batch_generate(
+                [final_prompt] * ITERATIONS, response_paths
+            )
+        else:
+            request_prompt, cached_content = final_prompt, None
+            if USE_PROMPT_CACHE and LLM_API_KEY == GEMINI_API_KEY:
+                # Struktur und Code werden einmal serverseitig gecacht, pro Iteration
+                # wird nur noch die Aufgabenstellung geschickt.
+                cached_content = await create_gemini_prompt_cache(context)
+                request_prompt = YOUR_PROMPT
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+            try:
+                responses = await asyncio.gather(
+                    *(
+                        generate(request_prompt, semaphore, path, cached_content)
+                        for path in response_paths
+                    ),
+                    return_exceptions=True,
+                )
+            finally:
+                if cached_content is not None:
+                    await client.aio.caches.delete(name=cached_content)
+
+    # Das Backup liegt neben dem Projekt auf demselben Dateisystem, sonst schlägt
+    # os.link in _hardlink_copy mit EXDEV fehl und jede Datei wird kopiert.
+    scratch_root = PROJECT_DIR.resolve().parent
+    work_dir = Path(tempfile.mkdtemp(prefix=".refac_", dir=scratch_root))
+    backup_dir = work_dir / "backup"
+    backup_project(PROJECT_DIR, backup_dir)
+    written: list[Path] = []
 
-        except Exception as e:
-            print(f"Fehler: {e}")
+    try:
+        for i, response in enumerate(responses, start=1):
+            print(f"\nITERATION {i}/{ITERATIONS}")
+            restore_project(backup_dir, PROJECT_DIR, written)
+            written = []
+
+            try:
+                if isinstance(response, BaseException):
+                    raise response
+                files, usage = response
+                if not files:
+                    continue
+
+                fingerprint = files_fingerprint(files)
+                test_result = result_cache.get(fingerprint)
+                if test_result is None:
+                    written = apply_changes(PROJECT_DIR, files)
+                    test_result = run_pytest()
+                    result_cache[fingerprint] = test_result
+                else:
+                    print(
+                        " Identische Dateien wie in einer früheren Iteration,"
+                        " Testergebnis übernommen."
+                    )
+                token_info = format_token_usage(usage)
+
+                if test_result["success"]:
+                    successful_iterations += 1
+                    write_summary(f"\nIteration {i} erfolgreich. {token_info}")
+                    print(" Tests bestanden.")
+                else:
+                    write_summary(f"\nIteration {i} fehlgeschlagen. {token_info}")
+                    print(" Tests fehlgeschlagen.")
+
+                save_results(i, RESULTS_DIR / f"iteration_{i:02d}", files, test_result)
+
+            except Exception as e:
+                print(f"Fehler: {e}")
+    finally:
+        restore_project(backup_dir, PROJECT_DIR, written)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print(f"\nFertig. Erfolgsrate: {successful_iterations / ITERATIONS * 100:.1f}%")
+    write_summary(
+        f"\nFertig. Erfolgsrate: {successful_iterations / ITERATIONS * 100:.1f}%"
+    )
 
-    print(f"\nFertig. Erfolgsrate: {successful_iterations/ITERATIONS*100:.1f}%")
-    restore_project(backup_dir, PROJECT_DIR)
-    write_summary(f"\nFertig. Erfolgsrate: {successful_iterations/ITERATIONS*100:.1f}%")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
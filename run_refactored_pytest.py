@@ -1,11 +1,18 @@
 import argparse
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+import difflib
+from functools import cache
+import multiprocessing
+import multiprocessing.queues
 import os
-import re
+from pathlib import Path
 import shutil
 import subprocess
-import difflib
-from datetime import datetime
-from pathlib import Path
+import tarfile
+
 
 PROJECT_SRC_PATH = Path("src/pluggy")
 REFACTORED_ROOT_PATH = Path("refactoring/rename_results2_gemini-3-pro-preview")
@@ -15,96 +22,179 @@ ITERATION_PREFIX = "iteration_"
 SUMMARY_FILENAME = "test_results.txt"
 ITERATION_RESULT_FILENAME = "test_result.txt"
 ITERATION_DIFF_FILENAME = "diff.txt"
+CODE_ARCHIVE_FILENAME = "code.tar.gz"
+PYTEST_TIMEOUT = 600
+SNAPSHOT_IGNORE_NAMES = frozenset(
+    {"__pycache__", ".git", "test", "tests", "pathlib2.egg-info"}
+)
+WORKDIR_PREFIX = "_work_"
+WORKDIR_IGNORE_NAMES = frozenset(
+    {
+        ".git",
+        "__pycache__",
+        ".tox",
+        ".venv",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+    }
+)
 
 
 def get_project_structure(project_dir: Path) -> str:
     """Erstellt eine Übersicht der Projektstruktur."""
     structure = []
-    for root, dirs, files in os.walk(project_dir):
-        dirs[:] = [
-            d
-            for d in dirs
-            if not d.startswith(".")
-            and d not in {"__pycache__", "tests", "pathlib2.egg-info"}
-        ]
-        level = root.replace(str(project_dir), "").count(os.sep)
+    # Explizite DFS mit os.scandir; Reihenfolge wie bei os.walk (top-down).
+    stack = [(os.fspath(project_dir), 0)]
+    while stack:
+        directory, level = stack.pop()
         indent = " " * 2 * level
-        structure.append(f"{indent}{os.path.basename(root)}/")
+        structure.append(f"{indent}{os.path.basename(directory)}/")
         subindent = " " * 2 * (level + 1)
-        for file in files:
-            if file.endswith(".py"):
-                structure.append(f"{subindent}{file}")
+        subdirs = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if (
+                        not entry.name.startswith(".")
+                        and entry.name
+                        not in {"__pycache__", "tests", "pathlib2.egg-info"}
+                        and not entry.is_symlink()
+                    ):
+                        subdirs.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    structure.append(f"{subindent}{entry.name}")
+        stack.extend((subdir, level + 1) for subdir in reversed(subdirs))
     return "\n".join(structure)
 
 
-def backup_project(project_dir: Path, backup_dir: Path) -> None:
-    """Erstellt ein Backup des Projekts."""
-    if backup_dir.exists():
-        shutil.rmtree(backup_dir)
-    shutil.copytree(
-        project_dir,
-        backup_dir,
-        ignore=shutil.ignore_patterns(
-            "__pycache__", "*.pyc", ".git", "test", "tests", "pathlib2.egg-info"
-        ),
-    )
+def snapshot_project(project_dir: Path) -> dict[str, bytes]:
+    """Liest den Ausgangszustand des Projekts einmalig in den Speicher."""
+    project_dir = Path(project_dir).resolve()
+    baseline: dict[str, bytes] = {}
+    for root, dirs, files in os.walk(project_dir):
+        dirs[:] = [d for d in dirs if d not in SNAPSHOT_IGNORE_NAMES]
+        for name in files:
+            if name in SNAPSHOT_IGNORE_NAMES or name.endswith(".pyc"):
+                continue
+            path = Path(root, name)
+            baseline[str(path.relative_to(project_dir))] = path.read_bytes()
+    return baseline
 
 
-def restore_project(backup_dir: Path, project_dir: Path) -> None:
-    """Stellt das Projekt aus dem Backup wieder her"""
-    backup_dir = Path(backup_dir).resolve()
-    project_dir = Path(project_dir).resolve()
+def _remove_empty_parents(directory: Path, project_dir: Path) -> None:
+    while directory != project_dir and project_dir in directory.parents:
+        try:
+            directory.rmdir()
+        except OSError:
+            return
+        directory = directory.parent
 
-    if not backup_dir.exists():
-        raise FileNotFoundError(f"Backup-Verzeichnis nicht gefunden: {backup_dir}")
 
-    if project_dir.exists():
-        shutil.rmtree(project_dir)
-    project_dir.mkdir(parents=True, exist_ok=True)
-    shutil.copytree(backup_dir, project_dir, dirs_exist_ok=True)
+def restore_overlay(
+    project_dir: Path, baseline: dict[str, bytes], touched: set[str]
+) -> None:
+    """Setzt nur die von apply_changes geschriebenen Dateien zurück."""
+    project_dir = Path(project_dir).resolve()
+    for rel in touched:
+        path = project_dir / rel
+        original = baseline.get(rel)
+        if original is None:
+            path.unlink(missing_ok=True)
+            _remove_empty_parents(path.parent, project_dir)
+            continue
+        try:
+            if path.read_bytes() == original:
+                continue
+        except OSError:
+            pass
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(original)
 
 
-def apply_changes(project_dir: Path | str, files: dict[str, str]) -> None:
-    """Wendet die Änderungen auf die Dateien an, ignoriert jedoch Dateien im 'tests'-Ordner."""
+def apply_changes(
+    project_dir: Path | str,
+    files: dict[str, bytes],
+    baseline: dict[str, bytes] | None = None,
+    verbose: bool = False,
+) -> set[str]:
+    """
+    Wendet die Änderungen auf die Dateien an. Test-Dateien sind bereits beim Einlesen
+    (should_skip_snapshot_path) aussortiert.
+    Dateien, deren Inhalt byte-identisch zum Ausgangszustand (baseline) ist, werden
+    nicht geschrieben. Gibt die relativen Pfade aller angefassten Dateien zurück.
+    Meldungen werden gesammelt und einmal ausgegeben; "aktualisiert" nur mit verbose.
+    """
     project_dir = Path(project_dir).resolve()
+    # Reiner String-Vergleich statt resolve() pro Datei: restore_overlay legt keine
+    # Symlinks an, ".." und absolute Pfade fängt normpath ab.
+    root = str(project_dir)
+    root_prefix = os.path.join(root, "")
+    touched: set[str] = set()
+    created_dirs: set[str] = set()
+    messages: list[str] = []
 
     for filename, code in files.items():
-        file_rel = Path(filename)
-
-        if any(part == "tests" for part in file_rel.parts):
+        file_path = os.path.normpath(os.path.join(root, filename))
+        if not file_path.startswith(root_prefix):
+            messages.append(
+                f" {filename} liegt außerhalb von {project_dir}, übersprungen"
+            )
             continue
 
-        file_path = (project_dir / file_rel).resolve()
-        try:
-            file_path.relative_to(project_dir)
-        except ValueError:
-            print(f" {filename} liegt außerhalb von {project_dir}, übersprungen")
+        rel = file_path[len(root_prefix) :]
+        if baseline is not None and baseline.get(rel) == code:
             continue
 
+        touched.add(rel)
         try:
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(code, encoding="utf-8")
-            print(f" {filename} aktualisiert")
+            parent = os.path.dirname(file_path)
+            if parent not in created_dirs:
+                os.makedirs(parent, exist_ok=True)
+                created_dirs.add(parent)
+            with open(file_path, "wb") as f:
+                f.write(code)
+            if verbose:
+                messages.append(f" {filename} aktualisiert")
         except Exception as e:
-            print(f" Fehler beim Schreiben von {filename}: {e}")
+            messages.append(f" Fehler beim Schreiben von {filename}: {e}")
+
+    if messages:
+        print("\n".join(messages))
+    return touched
+
 
+def run_pytest(cwd: Path, env: dict[str, str] | None = None) -> dict[str, object]:
+    """Führt pytest in einem frischen Prozess in cwd aus und gibt das Ergebnis zurück.
 
-def run_pytest():
-    """Führt pytest aus und gibt das Ergebnis zurück."""
+    Das Projekt ist pluggy, von dem pytest selbst abhängt: nur ein neuer Prozess
+    lädt für pytest und die Tests die refaktorierte Fassung.
+    """
     try:
         result = subprocess.run(
             ["pytest"],
+            check=False,
+            cwd=cwd,
+            env=env,
             capture_output=True,
             text=True,
+            timeout=PYTEST_TIMEOUT,
         )
+    except subprocess.TimeoutExpired:
         return {
-            "success": result.returncode == 0,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
-            "returncode": result.returncode,
+            "success": False,
+            "stdout": "",
+            "stderr": f"pytest nach {PYTEST_TIMEOUT}s abgebrochen",
+            "returncode": -1,
         }
-    except Exception as e:
+    except OSError as e:
         return {"success": False, "stdout": "", "stderr": str(e), "returncode": -1}
+    return {
+        "success": result.returncode == 0,
+        "stdout": result.stdout,
+        "stderr": result.stderr,
+        "returncode": result.returncode,
+    }
 
 
 def write_text_file(path: Path, content: str) -> None:
@@ -112,6 +202,7 @@ def write_text_file(path: Path, content: str) -> None:
     path.write_text(content, encoding="utf-8")
 
 
+@cache
 def parse_iteration_label(iteration_dir_name: str) -> str:
     """
     Converts "iteration_1" / "iteration_01" / "iteration_001" -> "iteration 1"
@@ -127,7 +218,9 @@ def parse_iteration_label(iteration_dir_name: str) -> str:
     return iteration_dir_name.replace("_", " ")
 
 
-def format_summary_line(iteration_dir_name: str, test_success: bool, diff_has_changes: bool) -> str:
+def format_summary_line(
+    iteration_dir_name: str, test_success: bool, diff_has_changes: bool
+) -> str:
     label = parse_iteration_label(iteration_dir_name)
     test_part = "test passed" if test_success else "test failed"
     diff_part = "diff passed" if diff_has_changes else "diff failed"
@@ -147,33 +240,32 @@ def save_iteration_result_files(
     - test_result.txt (test stdout/stderr/returncode + statuses)
     - diff.txt (only diffs, or "(no diff)")
     """
-    if result_dir.exists():
-        shutil.rmtree(result_dir)
+    # Beide Dateien werden beim Schreiben ohnehin überschrieben; kein rmtree nötig.
     result_dir.mkdir(parents=True, exist_ok=True)
 
     stdout = str(test_result.get("stdout", ""))
     stderr = str(test_result.get("stderr", ""))
     returncode = str(test_result.get("returncode", ""))
 
-    parts: list[str] = []
-    parts.append(f"TEST_STATUS: {test_status}")
-    parts.append(f"DIFF_STATUS: {diff_status}")
-    parts.append(f"RETURNCODE: {returncode}")
-    parts.append(f"TIMESTAMP: {datetime.now().isoformat()}")
+    header: list[str] = []
+    header.append(f"TEST_STATUS: {test_status}")
+    header.append(f"DIFF_STATUS: {diff_status}")
+    header.append(f"RETURNCODE: {returncode}")
+    header.append(f"TIMESTAMP: {datetime.now().isoformat()}")
 
     if note:
-        parts.append("")
-        parts.append(f"NOTE: {note}")
-
-    parts.append("")
-    parts.append("=== PYTEST STDOUT ===")
-    parts.append(stdout)
-    parts.append("")
-    parts.append("=== PYTEST STDERR ===")
-    parts.append(stderr)
-    parts.append("")
-
-    write_text_file(result_dir / ITERATION_RESULT_FILENAME, "\n".join(parts))
+        header.append("")
+        header.append(f"NOTE: {note}")
+
+    # Die (potenziell großen) pytest-Ausgaben werden direkt in die Datei kodiert,
+    # statt sie vorher mit dem Kopf zu einem weiteren großen String zu verbinden.
+    with open(result_dir / ITERATION_RESULT_FILENAME, "wb") as f:
+        f.write("\n".join(header).encode("utf-8"))
+        f.write(b"\n\n=== PYTEST STDOUT ===\n")
+        f.write(stdout.encode("utf-8"))
+        f.write(b"\n\n=== PYTEST STDERR ===\n")
+        f.write(stderr.encode("utf-8"))
+        f.write(b"\n")
 
     write_text_file(
         result_dir / ITERATION_DIFF_FILENAME,
@@ -182,48 +274,97 @@ def save_iteration_result_files(
 
 
 def should_skip_snapshot_path(relative_path: Path) -> bool:
+    """Sortiert alles mit "test" im Pfad aus (u. a. 'tests'-Ordner), einmalig."""
     for part in relative_path.parts:
         if "test" in part.lower():
             return True
     return False
 
 
-def collect_snapshot_files(code_dir: Path) -> dict[str, str]:
-    files: dict[str, str] = {}
-    for root, dirs, filenames in os.walk(code_dir):
-        dirs[:] = [d for d in dirs if not d.startswith(".")]
-        for filename in filenames:
-            if not filename.endswith(".py"):
+def _walk_snapshot_py_files(code_dir: Path) -> Iterator[tuple[str, os.DirEntry[str]]]:
+    """Liefert (relativer Pfad, DirEntry) aller nicht übersprungenen .py-Dateien."""
+    stack = [(os.fspath(code_dir), "")]
+    while stack:
+        directory, prefix = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # Ordner mit "test" im Namen würden ohnehin komplett übersprungen.
+                    if (
+                        not entry.name.startswith(".")
+                        and "test" not in entry.name.lower()
+                        and not entry.is_symlink()
+                    ):
+                        stack.append((entry.path, prefix + entry.name + os.sep))
+                elif entry.name.endswith(".py") and "test" not in entry.name.lower():
+                    yield prefix + entry.name, entry
+
+
+def collect_snapshot_files(code_dir: Path) -> dict[str, bytes]:
+    # Inhalte bleiben Bytes: apply_changes schreibt sie unverändert zurück.
+    files: dict[str, bytes] = {}
+    for relative_path, entry in _walk_snapshot_py_files(code_dir):
+        try:
+            with open(entry.path, "rb") as f:
+                files[relative_path] = f.read()
+        except Exception as e:
+            print(f"Fehler beim Lesen von {entry.path}: {e}")
+    return files
+
+
+def collect_snapshot_archive(archive_path: Path) -> dict[str, bytes]:
+    files: dict[str, bytes] = {}
+    with tarfile.open(archive_path, "r:*") as tar:
+        for member in tar:
+            if not member.isfile() or not member.name.endswith(".py"):
                 continue
-            file_path = Path(root) / filename
-            relative_path = file_path.relative_to(code_dir)
+            relative_path = Path(member.name)
             if should_skip_snapshot_path(relative_path):
                 continue
             try:
-                files[str(relative_path)] = file_path.read_text(encoding="utf-8")
+                files[str(relative_path)] = tar.extractfile(member).read()
             except Exception as e:
-                print(f"Fehler beim Lesen von {file_path}: {e}")
+                print(f"Fehler beim Lesen von {member.name} in {archive_path}: {e}")
     return files
 
 
 def find_iteration_dirs(refactored_root: Path) -> list[Path]:
     iteration_dirs: list[Path] = []
-    for root, dirs, _files in os.walk(refactored_root):
-        for directory in dirs:
-            if directory.startswith(ITERATION_PREFIX):
-                iteration_dirs.append(Path(root) / directory)
+    stack = [os.fspath(refactored_root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                if entry.name.startswith(ITERATION_PREFIX):
+                    # Iterationsordner enthalten nur Snapshots, nicht weiter absteigen.
+                    iteration_dirs.append(Path(entry.path))
+                elif not entry.is_symlink():
+                    stack.append(entry.path)
     iteration_dirs.sort()
     return iteration_dirs
 
 
+@cache
+def _resolved_root(root: Path) -> str:
+    return str(root.resolve())
+
+
 def ensure_within_root(root: Path, target: Path) -> Path:
-    root_resolved = root.resolve()
-    target_resolved = target.resolve()
-    try:
-        target_resolved.relative_to(root_resolved)
-    except ValueError as exc:
-        raise ValueError(f"Ungültiger Ergebnis-Pfad außerhalb von {root_resolved}") from exc
-    return target_resolved
+    # Wurzel nur einmal auflösen; das Ziel per os.path.abspath (reine
+    # String-Operation, keine lstat-Aufrufe pro Pfadkomponente) prüfen.
+    root_resolved = _resolved_root(root)
+    target_abs = os.path.abspath(target)
+    if target_abs != root_resolved and not target_abs.startswith(
+        os.path.join(root_resolved, "")
+    ):
+        raise ValueError(f"Ungültiger Ergebnis-Pfad außerhalb von {root_resolved}")
+    return Path(target_abs)
 
 
 def _read_text_best_effort(path: Path) -> str:
@@ -245,37 +386,81 @@ def _normalize_lines_ignore_whitespace_and_blanklines(text: str) -> list[str]:
     text = text.replace("\r\n", "\n").replace("\r", "\n")
     out: list[str] = []
     for line in text.split("\n"):
-        normalized = re.sub(r"\s+", "", line)
+        # Same result as re.sub(r"\s+", "", line) without the regex engine.
+        normalized = "".join(line.split())
         if normalized == "":
             continue
         out.append(normalized)
     return out
 
 
+def _line_ids(lines: list[str], ids: dict[str, int]) -> list[int]:
+    """Bildet jede Zeile auf eine Ganzzahl ab (gleiche Zeile -> gleiche Id)."""
+    return [ids.setdefault(line, len(ids)) for line in lines]
+
+
+def _format_range_unified(start: int, stop: int) -> str:
+    """Bereichsangabe im Format von difflib.unified_diff."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def _unified_diff_by_ids(
+    orig_lines: list[str],
+    new_lines: list[str],
+    fromfile: str,
+    tofile: str,
+) -> list[str]:
+    """
+    Entspricht difflib.unified_diff(..., lineterm="", n=0), vergleicht aber
+    Ganzzahl-Ids statt Strings und formatiert nur die geänderten Hunks.
+    """
+    ids: dict[str, int] = {}
+    matcher = difflib.SequenceMatcher(
+        None, _line_ids(orig_lines, ids), _line_ids(new_lines, ids)
+    )
+    out: list[str] = []
+    for group in matcher.get_grouped_opcodes(0):
+        if not out:
+            out.append(f"--- {fromfile}")
+            out.append(f"+++ {tofile}")
+        first, last = group[0], group[-1]
+        file1_range = _format_range_unified(first[1], last[2])
+        file2_range = _format_range_unified(first[3], last[4])
+        out.append(f"@@ -{file1_range} +{file2_range} @@")
+        for tag, i1, i2, j1, j2 in group:
+            if tag in ("replace", "delete"):
+                out.extend("-" + line for line in orig_lines[i1:i2])
+            if tag in ("replace", "insert"):
+                out.extend("+" + line for line in new_lines[j1:j2])
+    return out
+
+
 def build_diff_between_backup_and_refactored(
-    backup_dir: Path,
+    baseline: dict[str, bytes],
     project_src: Path,
-    snapshot_files: dict[str, str],
+    changed_files: Iterable[str],
 ) -> tuple[bool, str]:
     """
-    Returns (has_changes, diff_text).
-    - has_changes True if there is at least one meaningful diff (ignoring whitespace/linebreak changes).
+    Returns (has_changes, diff_text) for the files written by apply_changes.
+    - has_changes True if there is at least one meaningful diff
+      (ignoring whitespace/linebreak changes).
     - diff_text contains unified diffs for each changed file.
     """
     diffs: list[str] = []
     has_changes = False
 
-    rel_paths = sorted({str(Path(p)) for p in snapshot_files.keys()})
+    rel_paths = sorted({str(Path(p)) for p in changed_files})
     for rel in rel_paths:
         rel_path = Path(rel)
-
-        if any(part == "tests" for part in rel_path.parts):
-            continue
-
-        orig_path = backup_dir / rel_path
         new_path = project_src / rel_path
 
-        orig_text = _read_text_best_effort(orig_path) if orig_path.exists() else ""
+        orig_text = baseline.get(rel, b"").decode("utf-8", errors="replace")
         new_text = _read_text_best_effort(new_path) if new_path.exists() else ""
 
         orig_norm = _normalize_lines_ignore_whitespace_and_blanklines(orig_text)
@@ -285,15 +470,11 @@ def build_diff_between_backup_and_refactored(
             continue
 
         has_changes = True
-        diff_lines = list(
-            difflib.unified_diff(
-                orig_norm,
-                new_norm,
-                fromfile=f"backup/{rel}",
-                tofile=f"refactored/{rel}",
-                lineterm="",
-                n=0,
-            )
+        diff_lines = _unified_diff_by_ids(
+            orig_norm,
+            new_norm,
+            fromfile=f"backup/{rel}",
+            tofile=f"refactored/{rel}",
         )
         if diff_lines:
             diffs.append("\n".join(diff_lines))
@@ -305,12 +486,16 @@ def process_iteration(
     iteration_dir: Path,
     project_src: Path,
     results_root: Path,
-    backup_dir: Path,
+    baseline: dict[str, bytes],
+    workdir: Path | None = None,
+    pytest_env: dict[str, str] | None = None,
+    verbose: bool = False,
 ) -> tuple[bool, bool, str]:
     code_dir = iteration_dir / "code"
+    code_archive = iteration_dir / CODE_ARCHIVE_FILENAME
     result_dir = ensure_within_root(results_root, results_root / iteration_dir.name)
 
-    if not code_dir.exists():
+    if not code_dir.exists() and not code_archive.exists():
         test_result = {"stdout": "", "stderr": "", "returncode": -1, "success": False}
         diff_has_changes = False
         test_status = "FAILURE"
@@ -323,9 +508,16 @@ def process_iteration(
             "",
             note=f"Code-Verzeichnis fehlt: {code_dir}",
         )
-        return False, diff_has_changes, format_summary_line(iteration_dir.name, False, diff_has_changes)
+        return (
+            False,
+            diff_has_changes,
+            format_summary_line(iteration_dir.name, False, diff_has_changes),
+        )
 
-    snapshot_files = collect_snapshot_files(code_dir)
+    if code_archive.exists():
+        snapshot_files = collect_snapshot_archive(code_archive)
+    else:
+        snapshot_files = collect_snapshot_files(code_dir)
     if not snapshot_files:
         test_result = {"stdout": "", "stderr": "", "returncode": -1, "success": False}
         diff_has_changes = False
@@ -339,20 +531,23 @@ def process_iteration(
             "",
             note=f"Keine Python-Dateien in {code_dir}",
         )
-        return False, diff_has_changes, format_summary_line(iteration_dir.name, False, diff_has_changes)
-
-    backup_project(project_src, backup_dir)
+        return (
+            False,
+            diff_has_changes,
+            format_summary_line(iteration_dir.name, False, diff_has_changes),
+        )
 
     diff_has_changes = False
     diff_text = ""
+    touched: set[str] = set()
     try:
-        apply_changes(project_src, snapshot_files)
+        touched = apply_changes(project_src, snapshot_files, baseline, verbose=verbose)
         diff_has_changes, diff_text = build_diff_between_backup_and_refactored(
-            backup_dir=backup_dir, project_src=project_src, snapshot_files=snapshot_files
+            baseline=baseline, project_src=project_src, changed_files=touched
         )
-        test_result = run_pytest()
+        test_result = run_pytest(workdir or Path.cwd(), pytest_env)
     finally:
-        restore_project(backup_dir, project_src)
+        restore_overlay(project_src, baseline, touched)
 
     test_success = bool(test_result.get("success"))
     test_status = "SUCCESS" if test_success else "FAILURE"
@@ -369,7 +564,146 @@ def process_iteration(
         diff_text,
     )
 
-    return test_success, diff_has_changes, format_summary_line(iteration_dir.name, test_success, diff_has_changes)
+    return (
+        test_success,
+        diff_has_changes,
+        format_summary_line(iteration_dir.name, test_success, diff_has_changes),
+    )
+
+
+def _copy_file(src: str, dst: str) -> None:
+    """Kopiert den Dateiinhalt per os.sendfile im Kernel (Fallback: shutil.copyfile)."""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        offset = 0
+        remaining = os.fstat(fsrc.fileno()).st_size
+        try:
+            while remaining > 0:
+                sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, remaining)
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+            return
+        except (AttributeError, OSError):
+            if offset:
+                raise
+    shutil.copyfile(src, dst)
+
+
+def _fast_copytree(src: str, dst: str, skip: set[str]) -> None:
+    """Kopiert einen Baum ohne WORKDIR_IGNORE_NAMES, *.pyc und Pfade in skip."""
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            name = entry.name
+            if (
+                name in WORKDIR_IGNORE_NAMES
+                or name.endswith(".pyc")
+                or entry.path in skip
+            ):
+                continue
+            target = os.path.join(dst, name)
+            if entry.is_symlink():
+                os.symlink(os.readlink(entry.path), target)
+            elif entry.is_dir():
+                _fast_copytree(entry.path, target, skip)
+            else:
+                _copy_file(entry.path, target)
+
+
+def create_workdirs(
+    project_root: Path, results_root: Path, count: int, skip: set[Path]
+) -> list[Path]:
+    """Legt pro Worker eine eigene Kopie des Projekts unter results_root an."""
+    skip_paths = {os.fspath(path) for path in skip}
+    workdirs = []
+    for i in range(count):
+        workdir = ensure_within_root(
+            results_root, results_root / f"{WORKDIR_PREFIX}{i}"
+        )
+        if workdir.exists():
+            shutil.rmtree(workdir)
+        _fast_copytree(os.fspath(project_root), os.fspath(workdir), skip_paths)
+        workdirs.append(workdir)
+    return workdirs
+
+
+_worker_state: dict[str, object] = {}
+
+
+def _init_worker(
+    free_workdirs: multiprocessing.queues.Queue, project_rel: Path
+) -> None:
+    """Reserviert eine Arbeitskopie für diesen Prozess, liest ihren Ausgangszustand."""
+    workdir = free_workdirs.get()
+    project_src = workdir / project_rel
+    pythonpath = [str(project_src.parent)]
+    if os.environ.get("PYTHONPATH"):
+        pythonpath.append(os.environ["PYTHONPATH"])
+    _worker_state["workdir"] = workdir
+    _worker_state["project_src"] = project_src
+    _worker_state["baseline"] = snapshot_project(project_src)
+    _worker_state["pytest_env"] = {
+        **os.environ,
+        "PYTHONDONTWRITEBYTECODE": "1",
+        "PYTHONPATH": os.pathsep.join(pythonpath),
+    }
+
+
+def _process_iteration_in_worker(
+    iteration_dir: Path, results_root: Path, verbose: bool
+) -> tuple[bool, bool, str]:
+    return process_iteration(
+        iteration_dir,
+        _worker_state["project_src"],
+        results_root,
+        _worker_state["baseline"],
+        workdir=_worker_state["workdir"],
+        pytest_env=_worker_state["pytest_env"],
+        verbose=verbose,
+    )
+
+
+def run_iterations_parallel(
+    iteration_dirs: list[Path],
+    project_src: Path,
+    refactored_root: Path,
+    results_root: Path,
+    workers: int,
+    verbose: bool = False,
+) -> list[str]:
+    """
+    Führt die Iterationen parallel aus. Jeder Worker-Prozess testet in einer
+    eigenen Kopie des Projekts (Arbeitsverzeichnis = aktuelles Verzeichnis).
+    """
+    project_root = Path.cwd().resolve()
+    project_rel = project_src.relative_to(project_root)
+    # Ergebnis- und Iterationsordner (samt Oberordner) nicht mitkopieren.
+    skip = {
+        project_root / path.relative_to(project_root).parts[0]
+        for path in (refactored_root, results_root)
+        if path.is_relative_to(project_root) and path != project_root
+    }
+    workdirs = create_workdirs(project_root, results_root, workers, skip)
+    free_workdirs = multiprocessing.Queue()
+    for workdir in workdirs:
+        free_workdirs.put(workdir)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(free_workdirs, project_rel),
+        ) as executor:
+            results = executor.map(
+                _process_iteration_in_worker,
+                iteration_dirs,
+                [results_root] * len(iteration_dirs),
+                [verbose] * len(iteration_dirs),
+            )
+            return [line for _test_success, _diff_has_changes, line in results]
+    finally:
+        for workdir in workdirs:
+            shutil.rmtree(workdir, ignore_errors=True)
 
 
 def parse_args() -> argparse.Namespace:
@@ -392,6 +726,17 @@ def parse_args() -> argparse.Namespace:
         default=TEST_RESULTS_ROOT,
         help="Pfad zum Ausgabeordner test_results",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Anzahl paralleler Worker (1 = sequentiell im Projektverzeichnis)",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Jede geschriebene Datei ausgeben",
+    )
     return parser.parse_args()
 
 
@@ -402,7 +747,6 @@ def main() -> None:
     results_root = args.results_root.resolve()
 
     results_root.mkdir(parents=True, exist_ok=True)
-    backup_dir = ensure_within_root(results_root, results_root / "_backup")
 
     iteration_dirs = find_iteration_dirs(refactored_root)
     if not iteration_dirs:
@@ -412,12 +756,28 @@ def main() -> None:
         )
         return
 
-    summary_lines: list[str] = []
-    for iteration_dir in iteration_dirs:
-        _test_success, _diff_has_changes, line = process_iteration(
-            iteration_dir, project_src, results_root, backup_dir
+    workers = min(args.workers, len(iteration_dirs))
+    if workers > 1 and project_src.is_relative_to(Path.cwd().resolve()):
+        summary_lines = run_iterations_parallel(
+            iteration_dirs,
+            project_src,
+            refactored_root,
+            results_root,
+            workers,
+            args.verbose,
         )
-        summary_lines.append(line)
+    else:
+        baseline = snapshot_project(project_src)
+        summary_lines = []
+        for iteration_dir in iteration_dirs:
+            _test_success, _diff_has_changes, line = process_iteration(
+                iteration_dir,
+                project_src,
+                results_root,
+                baseline,
+                verbose=args.verbose,
+            )
+            summary_lines.append(line)
 
     write_text_file(
         ensure_within_root(results_root, results_root / SUMMARY_FILENAME),
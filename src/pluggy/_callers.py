@@ -31,9 +31,9 @@ def run_old_style_hookwrapper(
         _raise_wrapfail(teardown, "did not yield")
     try:
         res = yield
-        result = Result(res, None)
+        result = Result._ok(res)
     except BaseException as exc:
-        result = Result(None, exc)
+        result = Result._err(exc)
     try:
         teardown.send(result)
     except StopIteration:
@@ -85,7 +85,13 @@ def _multicall(
         try:
             for hook_impl in reversed(hook_impls):
                 try:
-                    args = [caller_kwargs[argname] for argname in hook_impl.argnames]
+                    arg_getter = hook_impl._arg_getter
+                    if arg_getter is None:
+                        args: Sequence[object] = ()
+                    elif len(hook_impl.argnames) == 1:
+                        args = (arg_getter(caller_kwargs),)
+                    else:
+                        args = arg_getter(caller_kwargs)
                 except KeyError as e:
                     for argname in hook_impl.argnames:
                         if argname not in caller_kwargs:
@@ -121,31 +127,33 @@ def _multicall(
         else:
             result = results
 
-        for teardown in reversed(teardowns):
-            try:
-                if exception is not None:
-                    try:
-                        teardown.throw(exception)
-                    except RuntimeError as re:
-                        if (
-                            isinstance(exception, StopIteration)
-                            and re.__cause__ is exception
-                        ):
-                            teardown.close()
-                            continue
-                        else:
-                            raise
-                else:
-                    teardown.send(result)
-                teardown.close()
-            except StopIteration as si:
-                result = si.value
-                exception = None
-                continue
-            except BaseException as e:
-                exception = e
-                continue
-            _raise_wrapfail(teardown, "has second yield")
+        # Pure non-wrapper calls have nothing to replay.
+        if teardowns:
+            for teardown in reversed(teardowns):
+                try:
+                    if exception is not None:
+                        try:
+                            teardown.throw(exception)
+                        except RuntimeError as re:
+                            if (
+                                isinstance(exception, StopIteration)
+                                and re.__cause__ is exception
+                            ):
+                                teardown.close()
+                                continue
+                            else:
+                                raise
+                    else:
+                        teardown.send(result)
+                    teardown.close()
+                except StopIteration as si:
+                    result = si.value
+                    exception = None
+                    continue
+                except BaseException as e:
+                    exception = e
+                    continue
+                _raise_wrapfail(teardown, "has second yield")
 
     if exception is not None:
         raise exception
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import bisect
 from collections.abc import Callable
 from collections.abc import Generator
 from collections.abc import Mapping
 from collections.abc import Sequence
 from collections.abc import Set
+import functools
 import inspect
+import operator
 import sys
+from types import CodeType
+from types import FunctionType
 from types import ModuleType
 from typing import Any
 from typing import Final
@@ -175,13 +180,19 @@ class HookimplMarker:
             return setattr_hookimpl_opts(function)
 
 
+_DEFAULT_HOOKIMPL_OPTS: Final[HookimplOpts] = {
+    "tryfirst": False,
+    "trylast": False,
+    "wrapper": False,
+    "hookwrapper": False,
+    "optionalhook": False,
+    "specname": None,
+}
+
+
 def normalize_hookimpl_opts(opts: HookimplOpts) -> None:
-    opts.setdefault("tryfirst", False)
-    opts.setdefault("trylast", False)
-    opts.setdefault("wrapper", False)
-    opts.setdefault("hookwrapper", False)
-    opts.setdefault("optionalhook", False)
-    opts.setdefault("specname", None)
+    # Same in-place result and key order as setdefault() per key, in two C calls.
+    opts.update({**_DEFAULT_HOOKIMPL_OPTS, **opts})
 
 
 _PYPY = hasattr(sys, "pypy_version_info")
@@ -200,10 +211,23 @@ def varnames(func: object) -> tuple[tuple[str, ...], tuple[str, ...]]:
         except Exception:
             return (), ()
 
-    try:
-        sig = inspect.signature(
-            func.__func__ if inspect.ismethod(func) else func
+    is_method = inspect.ismethod(func)
+    target = func.__func__ if is_method else func
+    if (
+        type(target) is FunctionType
+        and not hasattr(target, "__wrapped__")
+        and not hasattr(target, "__signature__")
+    ):
+        # Keyed on the code object, so the cache keeps neither the function nor
+        # a plugin instance alive.
+        return _code_varnames(
+            target.__code__,
+            len(target.__defaults__ or ()),
+            target.__qualname__,
+            is_method,
         )
+    try:
+        sig = inspect.signature(target)  # type: ignore[arg-type]
     except TypeError:
         return (), ()
 
@@ -211,23 +235,31 @@ def varnames(func: object) -> tuple[tuple[str, ...], tuple[str, ...]]:
         inspect.Parameter.POSITIONAL_ONLY,
         inspect.Parameter.POSITIONAL_OR_KEYWORD,
     )
-    _valid_params = {
-        name: param
-        for name, param in sig.parameters.items()
-        if param.kind in _valid_param_kinds
-    }
-    args = tuple(_valid_params)
-    defaults = (
-        tuple(
-            param.default
-            for param in _valid_params.values()
-            if param.default is not param.empty
-        )
-        or None
-    )
-
-    if defaults:
-        index = -len(defaults)
+    args_list: list[str] = []
+    num_defaults = 0
+    for name, param in sig.parameters.items():
+        if param.kind in _valid_param_kinds:
+            args_list.append(name)
+            if param.default is not param.empty:
+                num_defaults += 1
+    qualname: str = getattr(target, "__qualname__", "")
+    return _split_varnames(tuple(args_list), num_defaults, qualname, is_method)
+
+
+@functools.lru_cache(maxsize=2048)
+def _code_varnames(
+    code: CodeType, num_defaults: int, qualname: str, is_method: bool
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    # co_argcount covers positional-only and positional-or-keyword parameters.
+    args = code.co_varnames[: code.co_argcount]
+    return _split_varnames(args, num_defaults, qualname, is_method)
+
+
+def _split_varnames(
+    args: tuple[str, ...], num_defaults: int, qualname: str, is_method: bool
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    if num_defaults:
+        index = -num_defaults
         args, kwargs = args[:index], tuple(args[index:])
     else:
         kwargs = ()
@@ -237,8 +269,7 @@ def varnames(func: object) -> tuple[tuple[str, ...], tuple[str, ...]]:
     else:
         implicit_names = ("self", "obj")
     if args:
-        qualname: str = getattr(func, "__qualname__", "")
-        if inspect.ismethod(func) or ("." in qualname and args[0] in implicit_names):
+        if is_method or ("." in qualname and args[0] in implicit_names):
             args = args[1:]
 
     return args, kwargs
@@ -274,6 +305,7 @@ class HookCaller:
         "spec",
         "_hookexec",
         "_hookimpls",
+        "_hookimpls_version",
         "_call_history",
     )
 
@@ -288,6 +320,8 @@ class HookCaller:
         self.name: Final = name
         self._hookexec: Final = hook_execute
         self._hookimpls: Final[list[HookImpl]] = []
+        # Bumped on every change to _hookimpls, lets subset callers cache.
+        self._hookimpls_version = 0
         self._call_history: _CallHistory | None = None
         self.spec: HookSpec | None = None
         if specmodule_or_class is not None:
@@ -319,6 +353,7 @@ class HookCaller:
         for i, method in enumerate(self._hookimpls):
             if method.plugin == plugin:
                 del self._hookimpls[i]
+                self._hookimpls_version += 1
                 return
         raise ValueError(f"plugin {plugin!r} not found")
 
@@ -328,26 +363,22 @@ class HookCaller:
 
     def _add_hookimpl(self, hookimpl: HookImpl) -> None:
 
-        for i, method in enumerate(self._hookimpls):
-            if method.hookwrapper or method.wrapper:
-                splitpoint = i
-                break
-        else:
-            splitpoint = len(self._hookimpls)
-        if hookimpl.hookwrapper or hookimpl.wrapper:
-            start, end = splitpoint, len(self._hookimpls)
+        # The list is kept partitioned as [non-wrappers..., wrappers...], each
+        # part ordered trylast < normal < tryfirst, so positions can be bisected.
+        hookimpls = self._hookimpls
+        splitpoint = bisect.bisect_left(hookimpls, True, key=_is_wrapper)
+        if _is_wrapper(hookimpl):
+            start, end = splitpoint, len(hookimpls)
         else:
             start, end = 0, splitpoint
 
+        priority = _call_priority(hookimpl)
         if hookimpl.trylast:
-            self._hookimpls.insert(start, hookimpl)
-        elif hookimpl.tryfirst:
-            self._hookimpls.insert(end, hookimpl)
+            i = bisect.bisect_left(hookimpls, priority, start, end, key=_call_priority)
         else:
-            i = end - 1
-            while i >= start and self._hookimpls[i].tryfirst:
-                i -= 1
-            self._hookimpls.insert(i + 1, hookimpl)
+            i = bisect.bisect_right(hookimpls, priority, start, end, key=_call_priority)
+        hookimpls.insert(i, hookimpl)
+        self._hookimpls_version += 1
 
     def __repr__(self) -> str:
         return f"<HookCaller {self.name!r}>"
@@ -356,10 +387,12 @@ class HookCaller:
         if self.spec:
             for argname in self.spec.argnames:
                 if argname not in kwargs:
+                    # Spec argnames come from a signature, so they are plain
+                    # identifiers and quoting them by hand matches repr().
                     notincall = ", ".join(
-                        repr(argname)
+                        f"'{argname}'"
                         for argname in self.spec.argnames
-                        if argname not in kwargs.keys()
+                        if argname not in kwargs
                     )
                     warnings.warn(
                         f"Argument(s) {notincall} which are declared in the hookspec "
@@ -434,6 +467,18 @@ class HookCaller:
                     result_callback(res[0])
 
 
+def _is_wrapper(hookimpl: HookImpl) -> bool:
+    return hookimpl.hookwrapper or hookimpl.wrapper
+
+
+def _call_priority(hookimpl: HookImpl) -> int:
+    if hookimpl.trylast:
+        return 0
+    if hookimpl.tryfirst:
+        return 2
+    return 1
+
+
 _HookCaller = HookCaller
 
 
@@ -444,6 +489,8 @@ class _SubsetHookCaller(HookCaller):
     __slots__ = (
         "_orig",
         "_remove_plugins",
+        "_cached_hookimpls",
+        "_cached_version",
     )
 
     def __init__(self, orig: HookCaller, remove_plugins: Set[_Plugin]) -> None:
@@ -451,14 +498,20 @@ class _SubsetHookCaller(HookCaller):
         self._remove_plugins = remove_plugins
         self.name = orig.name
         self._hookexec = orig._hookexec
+        self._cached_hookimpls: list[HookImpl] = []
+        self._cached_version = -1
 
     @property
     def _hookimpls(self) -> list[HookImpl]:
-        return [
-            impl
-            for impl in self._orig._hookimpls
-            if impl.plugin not in self._remove_plugins
-        ]
+        version = self._orig._hookimpls_version
+        if self._cached_version != version:
+            self._cached_hookimpls = [
+                impl
+                for impl in self._orig._hookimpls
+                if impl.plugin not in self._remove_plugins
+            ]
+            self._cached_version = version
+        return self._cached_hookimpls
 
     @property
     def spec(self) -> HookSpec | None:
@@ -488,6 +541,7 @@ class HookImpl:
         "optionalhook",
         "tryfirst",
         "trylast",
+        "_arg_getter",
     )
 
     def __init__(
@@ -502,6 +556,7 @@ class HookImpl:
         argnames, kwargnames = varnames(self.function)
         self.argnames: Final = argnames
         self.kwargnames: Final = kwargnames
+        self._arg_getter: Final = _make_arg_getter(argnames)
         self.plugin: Final = plugin
         self.opts: Final = hook_impl_opts
         self.plugin_name: Final = plugin_name
@@ -515,6 +570,16 @@ class HookImpl:
         return f"<HookImpl plugin_name={self.plugin_name!r}, plugin={self.plugin!r}>"
 
 
+def _make_arg_getter(
+    argnames: tuple[str, ...],
+) -> Callable[[Mapping[str, object]], Any] | None:
+    # A single name makes itemgetter return the bare value; _multicall wraps
+    # it and handles the no-argument case itself.
+    if not argnames:
+        return None
+    return operator.itemgetter(*argnames)
+
+
 @final
 class HookSpec:
     __slots__ = (
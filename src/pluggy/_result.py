@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from types import TracebackType
-from typing import cast
 from typing import final
 from typing import Generic
 from typing import TypeAlias
@@ -35,14 +34,29 @@ class Result(Generic[ResultType]):
         self._exception = exception
         self._traceback = exception.__traceback__ if exception is not None else None
 
+    @classmethod
+    def _ok(cls, result: ResultType) -> Result[ResultType]:
+        # Specialized constructors for internal call sites, skipping __init__'s
+        # exception branch.
+        self = object.__new__(cls)
+        self._result = result
+        self._exception = None
+        self._traceback = None
+        return self
+
+    @classmethod
+    def _err(cls, exception: BaseException) -> Result[ResultType]:
+        self = object.__new__(cls)
+        self._result = None
+        self._exception = exception
+        self._traceback = exception.__traceback__
+        return self
+
     @property
     def excinfo(self) -> _ExcInfo | None:
 
         exc = self._exception
-        if exc is None:
-            return None
-        else:
-            return (type(exc), exc, self._traceback)
+        return None if exc is None else (type(exc), exc, self._traceback)
 
     @property
     def exception(self) -> BaseException | None:
@@ -53,12 +67,11 @@ class Result(Generic[ResultType]):
     def from_call(cls, func: Callable[[], ResultType]) -> Result[ResultType]:
 
         __tracebackhide__ = True
-        result = exception = None
         try:
             result = func()
         except BaseException as exc:
-            exception = exc
-        return cls(result, exception)
+            return cls._err(exc)
+        return cls._ok(result)
 
     def force_result(self, result: ResultType) -> None:
 
@@ -78,7 +91,7 @@ class Result(Generic[ResultType]):
         exc = self._exception
         tb = self._traceback
         if exc is None:
-            return cast(ResultType, self._result)
+            return self._result  # type: ignore[return-value]
         else:
             raise exc.with_traceback(tb)
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from collections.abc import Sequence
+import functools
 from typing import Any
 
 
@@ -11,6 +12,17 @@ _Writer = Callable[[str], object]
 _Processor = Callable[[tuple[str, ...], tuple[Any, ...]], object]
 
 
+# A given logger always passes the same tags tuple, so the suffix is reused.
+@functools.lru_cache(maxsize=256)
+def _tags_suffix(tags: tuple[str, ...]) -> str:
+    return f" [{':'.join(tags)}]\n"
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_tags(tags: str) -> tuple[str, ...]:
+    return tuple(tags.split(":"))
+
+
 class TagTracer:
     def __init__(self) -> None:
         self._tags2proc: dict[tuple[str, ...], _Processor] = {}
@@ -21,6 +33,9 @@ class TagTracer:
         return TagTracerSub(self, (name,))
 
     def _format_message(self, tags: Sequence[str], args: Sequence[object]) -> str:
+        if len(args) == 1 and not isinstance(args[0], dict):
+            return f"{'  ' * self.indent}{args[0]!s}{_tags_suffix(tuple(tags))}"
+
         if isinstance(args[-1], dict):
             extra = args[-1]
             args = args[:-1]
@@ -30,12 +45,12 @@ class TagTracer:
         content = " ".join(map(str, args))
         indent = "  " * self.indent
 
-        lines = [f"{indent}{content} [{':'.join(tags)}]\n"]
-
-        for name, value in extra.items():
-            lines.append(f"{indent}    {name}: {value}\n")
+        head = f"{indent}{content}{_tags_suffix(tuple(tags))}"
+        if not extra:
+            return head
 
-        return "".join(lines)
+        pad = indent + "    "
+        return head + "".join(f"{pad}{key}: {value}\n" for key, value in extra.items())
 
     def _processmessage(self, tags: tuple[str, ...], args: tuple[object, ...]) -> None:
         if self._writer is not None and args:
@@ -48,7 +63,7 @@ class TagTracer:
 
     def setprocessor(self, tags: str | tuple[str, ...], processor: _Processor) -> None:
         if isinstance(tags, str):
-            tags = tuple(tags.split(":"))
+            tags = _parse_tags(tags)
         else:
             assert isinstance(tags, tuple)
         self._tags2proc[tags] = processor
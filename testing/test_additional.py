@@ -82,6 +82,8 @@ def fn_pos_only_defaults(a=1, /, b=2) -> None:
 
 
 class SimpleInit:
+    __slots__ = ()
+
     def __init__(self, x, y=1) -> None:
         pass
 
@@ -91,36 +93,50 @@ class NoInit:
 
 
 class InitVarArgs:
+    __slots__ = ()
+
     def __init__(self, *args) -> None:
         pass
 
 
 class InitPosOnly:
+    __slots__ = ()
+
     def __init__(self, a, /, b, c=1) -> None:
         pass
 
 
 class CallOnly:
+    __slots__ = ()
+
     def __call__(self, x, y=1) -> None:
         pass
 
 
 class CallKwOnly:
+    __slots__ = ()
+
     def __call__(self, x, *, y) -> None:
         pass
 
 
 class CallPosOnly:
+    __slots__ = ()
+
     def __call__(self, a, /, b) -> None:
         pass
 
 
 class CallNoArgs:
+    __slots__ = ()
+
     def __call__(self) -> None:
         pass
 
 
 class MethodClass:
+    __slots__ = ()
+
     def method(self, x, y=1) -> None:
         pass
 
@@ -138,7 +154,7 @@ def plugin_function() -> None:
 
 
 class PluginClass:
-    pass
+    __slots__ = ("__name__",)
 
 
 class NamedPlugin:
@@ -416,6 +432,20 @@ def test_varnames_signatures(
     assert varnames(func_or_class) == expected
 
 
+@pytest.fixture
+def ok_result() -> Result[object]:
+    return Result("ok", None)
+
+
+@pytest.fixture
+def failed_result() -> Result[object]:
+    def boom() -> object:
+        raise ValueError("boom")
+
+    # Raised for real, so the result carries a traceback like a failed hook call.
+    return Result.from_call(boom)
+
+
 @pytest.mark.parametrize(
     "value",
     [
@@ -433,11 +463,10 @@ def test_varnames_signatures(
         None,
     ],
 )
-def test_result_force_result_clears_exception(value: object) -> None:
-    def raise_value_error() -> object:
-        raise ValueError("boom")
-
-    result = Result.from_call(raise_value_error)
+def test_result_force_result_clears_exception(
+    failed_result: Result[object], value: object
+) -> None:
+    result = failed_result
     result.force_result(value)
     assert result.get_result() == value
     assert result.exception is None
@@ -461,8 +490,10 @@ def test_result_force_result_clears_exception(value: object) -> None:
         AssertionError("assert"),
     ],
 )
-def test_result_force_exception_overrides_result(exc: BaseException) -> None:
-    result = Result.from_call(lambda: "ok")
+def test_result_force_exception_overrides_result(
+    ok_result: Result[object], exc: BaseException
+) -> None:
+    result = ok_result
     result.force_exception(exc)
     assert result.exception is exc
     with pytest.raises(type(exc)) as raised:
@@ -1,3 +1,10 @@
+import contextlib
+import functools
+import importlib.metadata
+import inspect
+import os
+from types import MappingProxyType
+from types import ModuleType
 import unittest
 from unittest import mock
 import warnings
@@ -20,9 +27,12 @@ from pluggy._warnings import PluggyTeardownRaisedWarning
 from pluggy._warnings import PluggyWarning
 
 
-def _mk_hookimpl(plugin, plugin_name, func, **opts):
-    """Helper function to create HookImpl instances for testing."""
-    full = {
+# Stand-in plugin for hookimpls whose plugin identity is never inspected.
+_SENTINEL = object()
+
+# Read-only so tests can share it without defensive copies.
+_DEFAULT_OPTS = MappingProxyType(
+    {
         "wrapper": False,
         "hookwrapper": False,
         "optionalhook": False,
@@ -30,20 +40,54 @@ def _mk_hookimpl(plugin, plugin_name, func, **opts):
         "trylast": False,
         "specname": None,
     }
-    full.update(opts)
-    normalize_hookimpl_opts(full)
-    return HookImpl(plugin, plugin_name, func, full)
+)
+
+
+@contextlib.contextmanager
+def _patch_attr(obj, name, value):
+    """Temporarily replace an attribute without going through mock.patch."""
+    old = getattr(obj, name)
+    setattr(obj, name, value)
+    try:
+        yield
+    finally:
+        setattr(obj, name, old)
+
+
+def _noop(*args, **kwargs):
+    pass
+
+
+def _impl_result(x):
+    return "result"
+
+
+def _wrapper_raises_in_teardown(x):
+    yield
+    raise ValueError("teardown error")
+
+
+@functools.cache
+def _compiled_module(path):
+    """Compile a module's source once per session."""
+    with open(path, encoding="utf-8") as f:
+        return compile(f.read(), path, "exec")
+
+
+def _mk_hookimpl(plugin, plugin_name, func, **opts):
+    """Helper function to create HookImpl instances for testing."""
+    # The template already holds every key, so normalizing would be a no-op.
+    return HookImpl(plugin, plugin_name, func, {**_DEFAULT_OPTS, **opts})
 
 
 class TestPluggyInit(unittest.TestCase):
     def test_all_exports_exist(self):
         # __all__ is defined and items are importable attributes from pluggy/__init__.py
         self.assertTrue(hasattr(pluggy, "__all__"))
-        for name in pluggy.__all__:
-            # __version__ is resolved by __getattr__
-            if name == "__version__":
-                continue
-            self.assertTrue(hasattr(pluggy, name), name)
+        # __version__ is resolved by __getattr__
+        names = set(pluggy.__all__) - {"__version__"}
+        missing = names - set(vars(pluggy))
+        self.assertFalse(missing, f"missing exports: {sorted(missing)}")
 
     def test_getattr_version(self):
         with mock.patch("importlib.metadata.version", return_value="9.9.9"):
@@ -77,8 +121,7 @@ class TestPluggyResult(unittest.TestCase):
         r = Result.from_call(boom)
         self.assertIsInstance(r.exception, ValueError)
         self.assertIsNotNone(r.excinfo)
-        with self.assertRaises(ValueError):
-            r.get_result()
+        self.assertRaises(ValueError, r.get_result)
 
     def test_result_force_result_clears_exception(self):
         r = Result(None, ValueError("x"))
@@ -91,8 +134,7 @@ class TestPluggyResult(unittest.TestCase):
         e = RuntimeError("nope")
         r.force_exception(e)
         self.assertIs(r.exception, e)
-        with self.assertRaises(RuntimeError):
-            r.get_result()
+        self.assertRaises(RuntimeError, r.get_result)
 
     def test_result_excinfo_property(self):
         """Test Result.excinfo property returns tuple."""
@@ -125,15 +167,17 @@ class TestPluggyResult(unittest.TestCase):
             raise ValueError("test")
         except ValueError as e:
             result = Result(None, e)
+            original_tb = e.__traceback__
 
         try:
             result.get_result()
-        except ValueError:
-            import traceback
-
-            tb_lines = traceback.format_exc()
-            self.assertIn("ValueError", tb_lines)
-            self.assertIn("test", tb_lines)
+        except ValueError as exc:
+            self.assertIs(exc, result.exception)
+            tb = exc.__traceback__
+        # The re-raise prepends frames; the original raise site must still be linked.
+        while tb is not None and tb is not original_tb:
+            tb = tb.tb_next
+        self.assertIs(tb, original_tb)
 
 
 class TestPluggyTracing(unittest.TestCase):
@@ -167,16 +211,16 @@ class TestPluggyTracing(unittest.TestCase):
 
         # If args empty -> writer should not run
         tracer2 = TagTracer()
-        out2 = []
-        tracer2.setwriter(lambda s: out2.append(s))
+        out2: list[str] = []
+        tracer2.setwriter(out2.append)
         tracer2.get("x").root._processmessage(("x",), ())
         self.assertEqual(out2, [])
 
     def test_tagtracer_formats_with_indent(self):
         """Test TagTracer indent handling."""
         tracer = TagTracer()
-        out = []
-        tracer.setwriter(lambda s: out.append(s))
+        out: list[str] = []
+        tracer.setwriter(out.append)
 
         sub = tracer.get("test")
         tracer.indent = 2
@@ -239,6 +283,15 @@ class TestPluggyTracing(unittest.TestCase):
 
 
 class TestHooksVarNamesAndMarkers(unittest.TestCase):
+    spec: HookspecMarker
+    impl: HookimplMarker
+
+    @classmethod
+    def setUpClass(cls):
+        # Markers are immutable, so one pair per class is enough.
+        cls.spec = HookspecMarker("proj")
+        cls.impl = HookimplMarker("proj")
+
     def test_varnames_for_function_and_defaults(self):
         def f(a, b, c=1, d=2):  # kwargs are the defaults tail
             return a, b, c, d
@@ -303,9 +356,7 @@ class TestHooksVarNamesAndMarkers(unittest.TestCase):
         """Test varnames uses PyPy implicit names when enabled."""
         import pluggy._hooks as hooks
 
-        original_pypy = hooks._PYPY
-        hooks._PYPY = True
-        try:
+        with mock.patch.object(hooks, "_PYPY", True):
             class C:
                 # Exercise PyPy implicit name handling.
                 def method(self, x):
@@ -314,11 +365,9 @@ class TestHooksVarNamesAndMarkers(unittest.TestCase):
             args, kwargs = hooks.varnames(C.method)
             self.assertEqual(args, ("x",))
             self.assertEqual(kwargs, ())
-        finally:
-            hooks._PYPY = original_pypy
 
     def test_hookspec_marker_sets_opts_and_validates_historic_firstresult(self):
-        spec = HookspecMarker("proj")
+        spec = self.spec
 
         @spec(firstresult=False, historic=True)
         def hook(x):  # noqa
@@ -335,7 +384,7 @@ class TestHooksVarNamesAndMarkers(unittest.TestCase):
                 return x
 
     def test_hookimpl_marker_sets_opts(self):
-        impl = HookimplMarker("proj")
+        impl = self.impl
 
         @impl(tryfirst=True, specname="hook")
         def implfn(x):  # noqa
@@ -348,22 +397,12 @@ class TestHooksVarNamesAndMarkers(unittest.TestCase):
     def test_normalize_hookimpl_opts_defaults(self):
         opts = {}
         normalize_hookimpl_opts(opts)
-        self.assertEqual(
-            opts,
-            {
-                "tryfirst": False,
-                "trylast": False,
-                "wrapper": False,
-                "hookwrapper": False,
-                "optionalhook": False,
-                "specname": None,
-            },
-        )
+        self.assertEqual(opts, dict(_DEFAULT_OPTS))
 
     def test_hookmarker_as_decorator_factory(self):
         """Test HookspecMarker and HookimplMarker as decorator factories."""
-        spec = HookspecMarker("proj")
-        impl = HookimplMarker("proj")
+        spec = self.spec
+        impl = self.impl
 
         # Use as decorator factory
         decorator = spec(firstresult=True)
@@ -388,25 +427,16 @@ class TestHooksVarNamesAndMarkers(unittest.TestCase):
 
 class TestCallersMulticall(unittest.TestCase):
     def _mk_hookimpl(self, plugin, plugin_name, func, **opts):
-        full = {
-            "wrapper": False,
-            "hookwrapper": False,
-            "optionalhook": False,
-            "tryfirst": False,
-            "trylast": False,
-            "specname": None,
-        }
-        full.update(opts)
-        normalize_hookimpl_opts(full)
-        return HookImpl(plugin, plugin_name, func, full)
+        return _mk_hookimpl(plugin, plugin_name, func, **opts)
 
     def test_multicall_missing_argument_raises_hookcallerror(self):
         def impl(a):  # expects a
             return a
 
-        hi = self._mk_hookimpl(object(), "p", impl)
-        with self.assertRaises(HookCallError):
-            _multicall("h", [hi], {"b": 1}, firstresult=False)
+        hi = self._mk_hookimpl(_SENTINEL, "p", impl)
+        self.assertRaises(
+            HookCallError, _multicall, "h", [hi], {"b": 1}, firstresult=False
+        )
 
     def test_multicall_firstresult_breaks(self):
         def impl1(x):
@@ -415,8 +445,8 @@ class TestCallersMulticall(unittest.TestCase):
         def impl2(x):
             return "r2"
 
-        hi1 = self._mk_hookimpl(object(), "p1", impl1)
-        hi2 = self._mk_hookimpl(object(), "p2", impl2)
+        hi1 = self._mk_hookimpl(_SENTINEL, "p1", impl1)
+        hi2 = self._mk_hookimpl(_SENTINEL, "p2", impl2)
         res = _multicall("h", [hi1, hi2], {"x": 1}, firstresult=True)
         self.assertEqual(res, "r2")  # reversed order, so hi2 runs first and breaks
 
@@ -429,8 +459,8 @@ class TestCallersMulticall(unittest.TestCase):
         def impl2(x):
             return None
 
-        hi1 = self._mk_hookimpl(object(), "p1", impl1)
-        hi2 = self._mk_hookimpl(object(), "p2", impl2)
+        hi1 = self._mk_hookimpl(_SENTINEL, "p1", impl1)
+        hi2 = self._mk_hookimpl(_SENTINEL, "p2", impl2)
 
         result = _multicall("h", [hi1, hi2], {"x": 1}, firstresult=True)
         self.assertIsNone(result)
@@ -440,53 +470,56 @@ class TestCallersMulticall(unittest.TestCase):
             if False:
                 yield None  # pragma: no cover
 
-        hi = self._mk_hookimpl(object(), "p", bad_old_style, hookwrapper=True)
+        hi = self._mk_hookimpl(_SENTINEL, "p", bad_old_style, hookwrapper=True)
         gen = run_old_style_hookwrapper(hi, "h", [1])
-        with self.assertRaises(RuntimeError):
-            next(gen)
+        self.assertRaises(RuntimeError, next, gen)
 
     def test_run_old_style_hookwrapper_second_yield_raises(self):
         def bad_two_yields(x):
             yield None
             _ = yield None  # second yield -> wrapfail
 
-        hi = self._mk_hookimpl(object(), "p", bad_two_yields, hookwrapper=True)
+        hi = self._mk_hookimpl(_SENTINEL, "p", bad_two_yields, hookwrapper=True)
         gen = run_old_style_hookwrapper(hi, "h", [1])
         next(gen)
-        with self.assertRaises(RuntimeError):
-            gen.send("ok")
+        self.assertRaises(RuntimeError, gen.send, "ok")
 
     def test_run_old_style_hookwrapper_teardown_raises_warns_and_reraises(self):
         def bad_teardown(x):
             yield None
             raise RuntimeError("boom in teardown")
 
-        hi = self._mk_hookimpl(object(), "p", bad_teardown, hookwrapper=True)
+        hi = self._mk_hookimpl(_SENTINEL, "p", bad_teardown, hookwrapper=True)
         gen = run_old_style_hookwrapper(hi, "h", [1])
         next(gen)
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
-            with self.assertRaises(RuntimeError):
-                gen.send("ok")
-            self.assertTrue(
-                any(isinstance(i.message, PluggyTeardownRaisedWarning) for i in w)
-            )
+        with self.assertWarns(PluggyTeardownRaisedWarning):
+            self.assertRaises(RuntimeError, gen.send, "ok")
 
     def test_multicall_wrapper_stopiteration_did_not_yield(self):
         def wrapper(x):
             if False:
                 yield None  # pragma: no cover
 
-        hi = self._mk_hookimpl(object(), "p", wrapper, wrapper=True)
-        with self.assertRaises(RuntimeError):
-            _multicall("h", [hi], {"x": 1}, firstresult=False)
+        hi = self._mk_hookimpl(_SENTINEL, "p", wrapper, wrapper=True)
+        self.assertRaises(
+            RuntimeError, _multicall, "h", [hi], {"x": 1}, firstresult=False
+        )
 
 
 class TestHookCallerBehavior(unittest.TestCase):
+    spec: HookspecMarker
+    impl: HookimplMarker
+
+    @classmethod
+    def setUpClass(cls):
+        # Markers are immutable, so one pair per class is enough.
+        cls.spec = HookspecMarker("proj")
+        cls.impl = HookimplMarker("proj")
+
     def test_hookcaller_call_historic_and_apply_history(self):
         pm = PluginManager("proj")
 
-        spec = HookspecMarker("proj")
+        spec = self.spec
 
         class Spec:
             @spec(historic=True)
@@ -495,7 +528,7 @@ class TestHookCallerBehavior(unittest.TestCase):
 
         pm.add_hookspecs(Spec)
 
-        impl = HookimplMarker("proj")
+        impl = self.impl
 
         class P1:
             @impl
@@ -525,7 +558,7 @@ class TestHookCallerBehavior(unittest.TestCase):
     def test_hookcaller_call_extra_orders_before_wrappers(self):
         pm = PluginManager("proj")
 
-        spec = HookspecMarker("proj")
+        spec = self.spec
 
         class Spec:
             @spec(firstresult=True)
@@ -534,7 +567,7 @@ class TestHookCallerBehavior(unittest.TestCase):
 
         pm.add_hookspecs(Spec)
 
-        impl = HookimplMarker("proj")
+        impl = self.impl
 
         class P:
             @impl(wrapper=True)
@@ -553,7 +586,7 @@ class TestHookCallerBehavior(unittest.TestCase):
         self.assertEqual(res, "extra")
 
     def test_hookcaller_remove_plugin_missing_raises(self):
-        hook = HookCaller("h", lambda *args, **kwargs: None)
+        hook = HookCaller("h", _noop)
         hook._add_hookimpl(_mk_hookimpl(object(), "p", lambda: None))
         with self.assertRaises(ValueError):
             hook._remove_plugin(object())
@@ -561,7 +594,7 @@ class TestHookCallerBehavior(unittest.TestCase):
     def test_subset_hook_caller(self):
         pm = PluginManager("proj")
 
-        spec = HookspecMarker("proj")
+        spec = self.spec
 
         class Spec:
             @spec
@@ -570,7 +603,7 @@ class TestHookCallerBehavior(unittest.TestCase):
 
         pm.add_hookspecs(Spec)
 
-        impl = HookimplMarker("proj")
+        impl = self.impl
 
         class P1:
             @impl
@@ -596,6 +629,31 @@ class TestHookCallerBehavior(unittest.TestCase):
 
 
 class TestPluginManager(unittest.TestCase):
+    spec: HookspecMarker
+    impl: HookimplMarker
+
+    @classmethod
+    def setUpClass(cls):
+        # Markers are immutable, so one pair per class is enough.
+        cls.spec = HookspecMarker("proj")
+        cls.impl = HookimplMarker("proj")
+
+    def _pm_with_h_specs(self) -> PluginManager:
+        spec = self.spec
+
+        class Spec:
+            @spec
+            def h(self):  # noqa
+                pass
+
+            @spec(historic=True)
+            def h_historic(self, x):  # noqa
+                pass
+
+        pm = PluginManager("proj")
+        pm.add_hookspecs(Spec)
+        return pm
+
     def test_register_duplicate_name_and_duplicate_plugin(self):
         pm = PluginManager("proj")
 
@@ -604,11 +662,9 @@ class TestPluginManager(unittest.TestCase):
 
         p = P()
         pm.register(p, name="same")
-        with self.assertRaises(ValueError):
-            pm.register(P(), name="same")
+        self.assertRaises(ValueError, pm.register, P(), name="same")
 
-        with self.assertRaises(ValueError):
-            pm.register(p, name="other")
+        self.assertRaises(ValueError, pm.register, p, name="other")
 
     def test_register_blocked_name_returns_none(self):
         pm = PluginManager("proj")
@@ -634,8 +690,7 @@ class TestPluginManager(unittest.TestCase):
         class Empty:
             pass
 
-        with self.assertRaises(ValueError):
-            pm.add_hookspecs(Empty)
+        self.assertRaises(ValueError, pm.add_hookspecs, Empty)
 
     def test_parse_hookimpl_opts_non_routine_is_none(self):
         pm = PluginManager("proj")
@@ -658,6 +713,7 @@ class TestPluginManager(unittest.TestCase):
         result = pm.parse_hookimpl_opts(P(), "f")
         self.assertIsNone(result)
 
+    @mock.patch.object(inspect, "isroutine", lambda obj: True)
     def test_parse_hookimpl_opts_getattr_exception(self):
         pm = PluginManager("proj")
 
@@ -671,70 +727,65 @@ class TestPluginManager(unittest.TestCase):
         class P:
             bad = BadMethod()
 
-        with mock.patch("pluggy._manager.inspect.isroutine", return_value=True):
-            result = pm.parse_hookimpl_opts(P(), "bad")
+        result = pm.parse_hookimpl_opts(P(), "bad")
         self.assertEqual(result, {})
 
-    def test_verify_hook_errors(self):
+    def _pm_with_spec(self, spec_cls: type) -> PluginManager:
         pm = PluginManager("proj")
-        spec = HookspecMarker("proj")
+        pm.add_hookspecs(spec_cls)
+        return pm
 
-        class Spec:
+    def test_verify_hook_errors(self):
+        spec = self.spec
+        impl = self.impl
+
+        class HistoricSpec:
             @spec(historic=True)
             def h(self, x):  # noqa
                 pass
 
-        pm.add_hookspecs(Spec)
-
-        impl = HookimplMarker("proj")
+        class Spec:
+            @spec
+            def h(self, x):  # noqa
+                pass
 
         class BadHistoricWrapper:
             @impl(wrapper=True)
             def h(self, x):  # noqa
                 yield
 
-        with self.assertRaises(PluginValidationError):
-            pm.register(BadHistoricWrapper())
-
         # Non-generator with wrapper=True
-        pm2 = PluginManager("proj")
-
-        class Spec2:
-            @spec
-            def h(self, x):  # noqa
-                pass
-
-        pm2.add_hookspecs(Spec2)
-
         class BadWrapperNotGen:
             @impl(wrapper=True)
             def h(self, x):  # noqa
                 return x
 
-        with self.assertRaises(PluginValidationError):
-            pm2.register(BadWrapperNotGen())
-
         # wrapper and hookwrapper mutually exclusive
         class BadMutual:
             @impl(wrapper=True, hookwrapper=True)
             def h(self, x):  # noqa
                 yield
 
-        with self.assertRaises(PluginValidationError):
-            pm2.register(BadMutual())
-
         # Hookimpl has arg not in spec
         class BadArgs:
             @impl
             def h(self, x, y):  # noqa
                 return x
 
-        with self.assertRaises(PluginValidationError):
-            pm2.register(BadArgs())
+        cases = [
+            (BadHistoricWrapper, HistoricSpec),
+            (BadWrapperNotGen, Spec),
+            (BadMutual, Spec),
+            (BadArgs, Spec),
+        ]
+        for bad_cls, spec_cls in cases:
+            with self.subTest(bad_cls.__name__):
+                pm = self._pm_with_spec(spec_cls)
+                self.assertRaises(PluginValidationError, pm.register, bad_cls())
 
     def test_check_pending_unknown_hook_raises(self):
         pm = PluginManager("proj")
-        impl = HookimplMarker("proj")
+        impl = self.impl
 
         class P:
             @impl(optionalhook=False)
@@ -742,12 +793,11 @@ class TestPluginManager(unittest.TestCase):
                 return None
 
         pm.register(P())
-        with self.assertRaises(PluginValidationError):
-            pm.check_pending()
+        self.assertRaises(PluginValidationError, pm.check_pending)
 
     def test_unregister_by_name_and_by_plugin(self):
         pm = PluginManager("proj")
-        spec = HookspecMarker("proj")
+        spec = self.spec
 
         class Spec:
             @spec
@@ -756,7 +806,7 @@ class TestPluginManager(unittest.TestCase):
 
         pm.add_hookspecs(Spec)
 
-        impl = HookimplMarker("proj")
+        impl = self.impl
 
         class P:
             @impl
@@ -797,6 +847,8 @@ class TestPluginManager(unittest.TestCase):
 
         # Build fake dist + entry points.
         class EP:
+            __slots__ = ("group", "name", "_plugin_obj")
+
             def __init__(self, group, name, plugin_obj):
                 self.group = group
                 self.name = name
@@ -806,12 +858,14 @@ class TestPluginManager(unittest.TestCase):
                 return self._plugin_obj
 
         class Dist:
+            __slots__ = ("metadata", "entry_points")
+
             def __init__(self, name, eps):
                 self.metadata = {"name": name}
                 self.entry_points = eps
 
-        impl = HookimplMarker("proj")
-        spec = HookspecMarker("proj")
+        impl = self.impl
+        spec = self.spec
 
         class Spec:
             @spec
@@ -827,12 +881,12 @@ class TestPluginManager(unittest.TestCase):
 
         dist = Dist("d1", [EP("grp", "ep1", P())])
 
-        with mock.patch("importlib.metadata.distributions", return_value=[dist]):
+        with _patch_attr(importlib.metadata, "distributions", lambda: [dist]):
             count = pm.load_setuptools_entrypoints("grp")
         self.assertEqual(count, 1)
 
         # Same EP name already registered -> skipped
-        with mock.patch("importlib.metadata.distributions", return_value=[dist]):
+        with _patch_attr(importlib.metadata, "distributions", lambda: [dist]):
             count2 = pm.load_setuptools_entrypoints("grp")
         self.assertEqual(count2, 0)
 
@@ -840,14 +894,14 @@ class TestPluginManager(unittest.TestCase):
         pm2 = PluginManager("proj")
         pm2.add_hookspecs(Spec)
         pm2.set_blocked("ep1")
-        with mock.patch("importlib.metadata.distributions", return_value=[dist]):
+        with _patch_attr(importlib.metadata, "distributions", lambda: [dist]):
             count3 = pm2.load_setuptools_entrypoints("grp")
         self.assertEqual(count3, 0)
 
     def test_add_hookcall_monitoring_and_enable_tracing(self):
         pm = PluginManager("proj")
-        spec = HookspecMarker("proj")
-        impl = HookimplMarker("proj")
+        spec = self.spec
+        impl = self.impl
 
         class Spec:
             @spec
@@ -866,10 +920,10 @@ class TestPluginManager(unittest.TestCase):
         events = []
 
         def before(name, methods, kwargs):
-            events.append(("before", name, dict(kwargs)))
+            events.append(("before", name, kwargs))
 
         def after(outcome, name, methods, kwargs):
-            events.append(("after", name, dict(kwargs), outcome.exception))
+            events.append(("after", name, kwargs, outcome.exception))
 
         undo = pm.add_hookcall_monitoring(before, after)
         self.assertEqual(pm.hook.h(x=1), [2])
@@ -885,7 +939,7 @@ class TestPluginManager(unittest.TestCase):
     def test_hookcaller_missing_arg_raises_hookcallerror(self):
         """Test that HookCallError is raised when required argument is missing."""
         pm = PluginManager("proj")
-        spec = HookspecMarker("proj")
+        spec = self.spec
 
         class Spec:
             @spec
@@ -894,7 +948,7 @@ class TestPluginManager(unittest.TestCase):
 
         pm.add_hookspecs(Spec)
 
-        impl = HookimplMarker("proj")
+        impl = self.impl
 
         class P:
             @impl
@@ -904,10 +958,8 @@ class TestPluginManager(unittest.TestCase):
         pm.register(P())
 
         # Should warn first, then raise HookCallError in _multicall
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")  # Suppress the warning
-            with self.assertRaises(HookCallError):
-                pm.hook.h(a=1)
+        with self.assertWarnsRegex(UserWarning, "cannot be found in this hook call"):
+            self.assertRaises(HookCallError, pm.hook.h, a=1)
 
     def test_warn_for_function_called(self):
         """Test _warn_for_function issues warnings correctly."""
@@ -927,8 +979,8 @@ class TestPluginManager(unittest.TestCase):
     def test_hookspec_warn_on_impl_triggers(self):
         """Test that hookspec warn_on_impl triggers warnings."""
         pm = PluginManager("proj")
-        spec = HookspecMarker("proj")
-        impl = HookimplMarker("proj")
+        spec = self.spec
+        impl = self.impl
 
         my_warning = DeprecationWarning("This hook is deprecated")
 
@@ -944,17 +996,15 @@ class TestPluginManager(unittest.TestCase):
             def h(self, x):  # noqa
                 return x
 
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
+        # Should trigger the warning
+        with self.assertWarnsRegex(DeprecationWarning, "deprecated"):
             pm.register(P())
-            # Should have triggered the warning
-            self.assertTrue(any("deprecated" in str(warning.message) for warning in w))
 
     def test_hookspec_warn_on_impl_args_triggers(self):
         """Test that hookspec warn_on_impl_args triggers warnings for specific arguments."""
         pm = PluginManager("proj")
-        spec = HookspecMarker("proj")
-        impl = HookimplMarker("proj")
+        spec = self.spec
+        impl = self.impl
 
         arg_warning = DeprecationWarning("Argument x is deprecated")
 
@@ -970,19 +1020,17 @@ class TestPluginManager(unittest.TestCase):
             def h(self, x, y):  # noqa
                 return x + y
 
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
+        # Should trigger the argument warning
+        with self.assertWarnsRegex(DeprecationWarning, "Argument x is deprecated"):
             pm.register(P())
-            # Should have triggered the argument warning
-            self.assertTrue(
-                any("Argument x is deprecated" in str(warning.message) for warning in w)
-            )
 
     def test_distfacade_properties(self):
         """Test DistFacade wrapper for distribution metadata."""
         from pluggy._manager import DistFacade
 
         class MockDist:
+            __slots__ = ("metadata", "version")
+
             def __init__(self):
                 self.metadata = {"name": "test-package"}
                 self.version = "1.0.0"
@@ -994,29 +1042,20 @@ class TestPluginManager(unittest.TestCase):
 
     def test_hookcaller_repr(self):
         """Test HookCaller __repr__."""
-        pm = PluginManager("proj")
-        spec = HookspecMarker("proj")
-
-        class Spec:
-            @spec
-            def h(self):  # noqa
-                pass
-
-        pm.add_hookspecs(Spec)
-        self.assertIn("HookCaller", repr(pm.hook.h))
-        self.assertIn("'h'", repr(pm.hook.h))
+        pm = self._pm_with_h_specs()
+        self.assertEqual(repr(pm.hook.h), "<HookCaller 'h'>")
 
     def test_hookimpl_repr(self):
         """Test HookImpl __repr__."""
-        hi = _mk_hookimpl(object(), "test_plugin", lambda x: x)
-        repr_str = repr(hi)
-        self.assertIn("HookImpl", repr_str)
-        self.assertIn("test_plugin", repr_str)
+        hi = _mk_hookimpl(_SENTINEL, "test_plugin", lambda x: x)
+        self.assertTrue(
+            repr(hi).startswith("<HookImpl plugin_name='test_plugin', plugin=")
+        )
 
     def test_subset_hookcaller_repr(self):
         """Test _SubsetHookCaller __repr__."""
         pm = PluginManager("proj")
-        spec = HookspecMarker("proj")
+        spec = self.spec
 
         class Spec:
             @spec
@@ -1025,7 +1064,7 @@ class TestPluginManager(unittest.TestCase):
 
         pm.add_hookspecs(Spec)
 
-        impl = HookimplMarker("proj")
+        impl = self.impl
 
         class P:
             @impl
@@ -1036,57 +1075,33 @@ class TestPluginManager(unittest.TestCase):
         pm.register(p)
 
         subset = pm.subset_hook_caller("h", [p])
-        repr_str = repr(subset)
-        self.assertIn("_SubsetHookCaller", repr_str)
-        self.assertIn("'h'", repr_str)
+        self.assertEqual(repr(subset), "<_SubsetHookCaller 'h'>")
 
     def test_hookcaller_call_historic_asserts_on_direct_call(self):
         """Test that calling a historic hook directly raises AssertionError."""
-        pm = PluginManager("proj")
-        spec = HookspecMarker("proj")
-
-        class Spec:
-            @spec(historic=True)
-            def h(self, x):  # noqa
-                pass
-
-        pm.add_hookspecs(Spec)
-
-        with self.assertRaises(AssertionError):
-            pm.hook.h(x=1)
+        pm = self._pm_with_h_specs()
+        self.assertRaises(AssertionError, pm.hook.h_historic, x=1)
 
     def test_hookcaller_call_extra_asserts_on_historic(self):
         """Test that call_extra on historic hook raises AssertionError."""
-        pm = PluginManager("proj")
-        spec = HookspecMarker("proj")
-
-        class Spec:
-            @spec(historic=True)
-            def h(self, x):  # noqa
-                pass
-
-        pm.add_hookspecs(Spec)
-
-        with self.assertRaises(AssertionError):
-            pm.hook.h.call_extra([], {"x": 1})
+        pm = self._pm_with_h_specs()
+        self.assertRaises(AssertionError, pm.hook.h_historic.call_extra, [], {"x": 1})
 
     def test_multicall_wrapper_teardown_exception_continues(self):
         """Test that exceptions in teardown are propagated."""
-
-        def impl(x):
-            return "result"
-
-        def wrapper_raises_in_teardown(x):
-            yield
-            raise ValueError("teardown error")
-
-        hi_impl = _mk_hookimpl(object(), "impl", impl)
+        hi_impl = _mk_hookimpl(_SENTINEL, "impl", _impl_result)
         hi_wrapper = _mk_hookimpl(
-            object(), "wrapper", wrapper_raises_in_teardown, wrapper=True
+            _SENTINEL, "wrapper", _wrapper_raises_in_teardown, wrapper=True
         )
 
-        with self.assertRaises(ValueError):
-            _multicall("h", [hi_wrapper, hi_impl], {"x": 1}, firstresult=False)
+        self.assertRaises(
+            ValueError,
+            _multicall,
+            "h",
+            [hi_wrapper, hi_impl],
+            {"x": 1},
+            firstresult=False,
+        )
 
     def test_multicall_wrapper_teardown_continues_on_stopiteration(self):
         """Test that StopIteration in teardown updates result and continues."""
@@ -1101,15 +1116,15 @@ class TestPluginManager(unittest.TestCase):
             # Return a new value
             return "new_value"
 
-        hi_impl = _mk_hookimpl(object(), "impl", impl)
+        hi_impl = _mk_hookimpl(_SENTINEL, "impl", impl)
         hi_wrapper = _mk_hookimpl(
-            object(), "wrapper", wrapper_with_return_value, wrapper=True
+            _SENTINEL, "wrapper", wrapper_with_return_value, wrapper=True
         )
 
         result = _multicall("h", [hi_wrapper, hi_impl], {"x": 1}, firstresult=False)
-        # The wrapper returns a value, which becomes the result
-        self.assertEqual(result, "new_value")
-        self.assertEqual(yielded_values, [["result"]])
+        # The wrapper returns a value, which becomes the result, and saw the
+        # inner results on resume.
+        self.assertEqual((result, yielded_values), ("new_value", [["result"]]))
 
     def test_multicall_wrapper_returns_value_via_stopiteration(self):
         """Test wrapper returning value which creates StopIteration with value."""
@@ -1124,30 +1139,41 @@ class TestPluginManager(unittest.TestCase):
             # Return a new value
             return "wrapper_override"
 
-        hi_impl = _mk_hookimpl(object(), "impl", impl)
-        hi_wrapper = _mk_hookimpl(object(), "wrapper", wrapper_returns, wrapper=True)
+        hi_impl = _mk_hookimpl(_SENTINEL, "impl", impl)
+        hi_wrapper = _mk_hookimpl(_SENTINEL, "wrapper", wrapper_returns, wrapper=True)
 
         result = _multicall("h", [hi_wrapper, hi_impl], {"x": 1}, firstresult=False)
         # Wrapper's return value should override
-        self.assertEqual(result, "wrapper_override")
-        self.assertEqual(yielded_values, [["impl_result"]])
+        self.assertEqual(
+            (result, yielded_values), ("wrapper_override", [["impl_result"]])
+        )
 
 
 class TestCoverageReloads(unittest.TestCase):
     def test_reload_modules_for_full_coverage(self):
-        import runpy
+        # Opt-out for quick runs that do not measure coverage; the default
+        # run does (--cov in addopts), so the flag is never set by default.
+        if os.environ.get("PLUGGY_SKIP_RELOAD"):
+            self.skipTest("module reload disabled by PLUGGY_SKIP_RELOAD")
         import typing
         import pluggy
         from pluggy import _callers, _hooks, _manager, _result, _tracing, _warnings
 
-        def run_module_path(module, run_name):
-            """Re-execute module initialization via runpy for coverage.
+        def run_module_path(module: ModuleType, run_name: str) -> None:
+            """Re-execute module initialization for coverage.
 
             Args:
                 module: Imported module object to execute.
-                run_name: Name used for __name__/__package__ during execution.
+                run_name: Name used for __name__ during execution.
             """
-            runpy.run_path(module.__file__, run_name=run_name)
+            # Same globals runpy.run_path would set up; "pluggy" as the package
+            # keeps the modules' relative imports working.
+            init_globals = {
+                "__name__": run_name,
+                "__file__": module.__file__,
+                "__package__": "pluggy",
+            }
+            exec(_compiled_module(module.__file__), init_globals)
 
         original_type_checking = typing.TYPE_CHECKING
         try:
@@ -1161,7 +1187,7 @@ class TestCoverageReloads(unittest.TestCase):
         run_module_path(_result, "pluggy._result_coverage")
         run_module_path(_tracing, "pluggy._tracing_coverage")
         run_module_path(_warnings, "pluggy._warnings_coverage")
-        runpy.run_path(pluggy.__file__, run_name="pluggy._coverage")
+        run_module_path(pluggy, "pluggy._coverage")
 
 
 if __name__ == "__main__":
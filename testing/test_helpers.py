@@ -1,8 +1,10 @@
 from collections.abc import Callable
 from functools import wraps
+import gc
 from typing import Any
 from typing import cast
 from typing import TypeVar
+import weakref
 
 from pluggy._hooks import varnames
 from pluggy._manager import _formatdef
@@ -68,6 +70,34 @@ def test_varnames_keyword_only() -> None:
     assert varnames(f3) == ((), ("x",))
 
 
+def test_varnames_unhashable() -> None:
+    assert varnames([]) == ((), ())
+
+
+def test_varnames_cache_does_not_keep_instance_alive() -> None:
+    class A:
+        def f(self, y) -> None:
+            pass  # pragma: no cover
+
+    a = A()
+    ref = weakref.ref(a)
+    assert varnames(a.f) == (("y",), ())
+    del a
+    gc.collect()
+    assert ref() is None
+
+
+def test_varnames_cache_does_not_keep_function_alive() -> None:
+    def f(x, y=1) -> None:
+        pass  # pragma: no cover
+
+    ref = weakref.ref(f)
+    assert varnames(f) == (("x",), ("y",))
+    del f
+    gc.collect()
+    assert ref() is None
+
+
 def test_formatdef() -> None:
     def function1():
         pass
@@ -511,3 +511,31 @@ def test_call_extra_hook_order(hc: HookCaller, addmeth: AddMeth) -> None:
         "2",
         "3",
     ]
+
+
+def test_repeated_calls_follow_registration_changes(
+    pm: PluginManager, hc: HookCaller
+) -> None:
+    class Plugin1:
+        @hookimpl
+        def he_method1(self, arg: int) -> int:
+            return arg
+
+    class Plugin2:
+        @hookimpl(wrapper=True)
+        def he_method1(self, arg: int) -> Generator[None, list[int], list[int]]:
+            result = yield
+            return [*result, arg * 10]
+
+    plugin1 = Plugin1()
+    pm.register(plugin1)
+    for _ in range(3):
+        assert hc(arg=1) == [1]
+
+    pm.register(Plugin2())
+    for _ in range(3):
+        assert hc(arg=2) == [2, 20]
+
+    pm.unregister(plugin1)
+    for _ in range(3):
+        assert hc(arg=3) == [30]
@@ -493,6 +493,12 @@ def test_subset_hook_caller(pm: PluginManager) -> None:
 
     pm.hook.he_method1(arg=1)
     assert out == [10]
+    out[:] = []
+
+    plugin1b = Plugin1()
+    pm.register(plugin1b)
+    hc(arg=3)
+    assert out == [3]
 
     assert repr(hc) == "<_SubsetHookCaller 'he_method1'>"
 
@@ -1,34 +1,35 @@
 import unittest
 import inspect
-import dis
-import inspect
+from types import SimpleNamespace
 import pytest
 
 from pluggy._callers import _multicall
 from pluggy import HookspecMarker, HookimplMarker, PluginManager
-from pluggy._hooks import HookCaller, HookImpl
+from pluggy._hooks import HookImpl, HookimplOpts
 
 from pluggy._manager import DistFacade
 from pluggy._result import HookCallError
 
 
-class FakeDist:
-    def __init__(self, name: str) -> None:
-        self.metadata = {"name": name}
+def fake_dist(name: str) -> SimpleNamespace:
+    return SimpleNamespace(metadata={"name": name})
 
 
 class TestDistFacadeProjectNameInline(unittest.TestCase):
     def test_project_name_returns_metadata_name(self):
-        df = DistFacade(FakeDist("pluggy-sample"))
+        df = DistFacade(fake_dist("pluggy-sample"))
         self.assertEqual(df.project_name, "pluggy-sample")
 
     @unittest.skip("Skipping test for inlining variable name")
     def test_inline_variable_name_is_applied(self):
         func = DistFacade.project_name.fget
         self.assertTrue(inspect.isfunction(func))
-        self.assertNotIn("name", func.__code__.co_varnames)
-        for ins in dis.get_instructions(func):
-            self.assertFalse(ins.opname.startswith("STORE") and ins.argval == "name")
+        code = func.__code__
+        # STORE_FAST/STORE_DEREF targets live in co_varnames/co_cellvars,
+        # STORE_NAME/STORE_GLOBAL/STORE_ATTR targets in co_names.
+        self.assertNotIn("name", code.co_varnames)
+        self.assertNotIn("name", code.co_cellvars)
+        self.assertNotIn("name", code.co_names)
 
 class TestGetterSetter:
 
@@ -64,24 +65,6 @@ class TestGetterSetter:
         res = pm.hook.he_method1(x=3)
         assert res == [3]
 
-def create_impl(function, **kwargs):
-    """
-    Erstellt eine HookImpl-Instanz für Testzwecke.
-    """
-    # Standard-Optionen
-    opts: HookimplOpts = {
-        "wrapper": False,
-        "hookwrapper": False,
-        "optionalhook": False,
-        "tryfirst": False,
-        "trylast": False,
-        "specname": None,
-    }
-    opts.update(kwargs)
-    
-    # Dummy Plugin-Objekt und Name
-    return HookImpl(None, "test_plugin", function, opts)
-
 def create_impl(function, **kwargs):
     """
     Erstellt eine HookImpl-Instanz, die genau so aussieht, 
@@ -102,90 +85,78 @@ def create_impl(function, **kwargs):
 
 # --- REGRESSION TESTS (VERHALTENS-GARANTIE) ---
 
-def test_multicall_behavior_collect_all():
-    """
-    Verifiziert: firstresult=False
-    - Muss alle Ergebnisse sammeln.
-    - Muss in umgekehrter Reihenfolge (LIFO) ausführen.
-    """
-    def hook_a(arg): return "A"
-    def hook_b(arg): return "B"
-
-    # Registrierungsreihenfolge: A, dann B.
-    # Ausführung (_multicall reversed): B, dann A.
-    impls = [create_impl(hook_a), create_impl(hook_b)]
-    
-    # Aufruf
-    res = _multicall("test_hook", impls, {"arg": 1}, firstresult=False)
-    
-    # Erwartung: Liste [B, A]
-    assert res == ["B", "A"]
-
-def test_multicall_behavior_firstresult():
-    """
-    Verifiziert: firstresult=True
-    - Muss stoppen, sobald ein Ergebnis nicht None ist.
-    - Muss None-Ergebnisse überspringen.
-    - Muss nachfolgende Hooks ignorieren.
-    """
-    def hook_none(arg): return None
-    def hook_winner(arg): return "Winner"
-    def hook_loser(arg): raise RuntimeError("Sollte nicht aufgerufen werden!")
-
-    # Registrierung: Loser, Winner, None
-    # Ausführung reversed: None -> Winner (STOP) -> Loser (skipped)
-    impls = [
-        create_impl(hook_loser), 
-        create_impl(hook_winner), 
-        create_impl(hook_none)
-    ]
-    
-    res = _multicall("test_hook", impls, {"arg": 1}, firstresult=True)
-    
-    assert res == "Winner"
-
-def test_multicall_behavior_firstresult_no_match():
-    """
-    Verifiziert: firstresult=True
-    - Muss None zurückgeben, wenn kein Hook ein Ergebnis liefert.
-    """
-    def hook_none(arg): return None
-    
-    impls = [create_impl(hook_none)]
-    res = _multicall("test_hook", impls, {"arg": 1}, firstresult=True)
-    
-    assert res is None
-
-def test_multicall_argument_mapping():
-    """
-    Verifiziert: Argument-Parsing
-    - Muss Argumente anhand der Parameternamen der Funktion zuordnen.
-    - Überflüssige kwargs müssen ignoriert werden.
-    """
-    def hook(x, y): 
-        return x + y
-
-    impls = [create_impl(hook)]
-    kwargs = {"x": 10, "y": 20, "unused": 999}
-    
-    res = _multicall("test_hook", impls, kwargs, firstresult=False)
-    
-    assert res == [30]
-
-def test_multicall_missing_argument_error():
-    """
-    Verifiziert: Error Handling
-    - Muss HookCallError werfen, wenn ein benötigtes Argument fehlt.
-    """
-    def hook(required_arg): return True
-
-    impls = [create_impl(hook)]
-    kwargs = {"wrong_arg": 1}
-
-    with pytest.raises(HookCallError) as excinfo:
-        _multicall("test_hook", impls, kwargs, firstresult=False)
-    
-    assert "must provide argument 'required_arg'" in str(excinfo.value)
+def _hook_a(arg): return "A"
+def _hook_b(arg): return "B"
+def _hook_none(arg): return None
+def _hook_winner(arg): return "Winner"
+def _hook_loser(arg): raise RuntimeError("Sollte nicht aufgerufen werden!")
+def _hook_sum(x, y): return x + y
+def _hook_required(required_arg): return True
+def _hook_crash(arg): raise ValueError("Crash!")
+
+@pytest.mark.parametrize(
+    ("hooks", "kwargs", "firstresult", "expected"),
+    [
+        # firstresult=False: sammelt alle Ergebnisse, Ausführung reversed (B, dann A).
+        pytest.param(
+            [_hook_a, _hook_b], {"arg": 1}, False, ["B", "A"], id="collect_all"
+        ),
+        # firstresult=True: None -> Winner (STOP) -> Loser (skipped).
+        pytest.param(
+            [_hook_loser, _hook_winner, _hook_none],
+            {"arg": 1},
+            True,
+            "Winner",
+            id="firstresult",
+        ),
+        # firstresult=True: None, wenn kein Hook ein Ergebnis liefert.
+        pytest.param(
+            [_hook_none], {"arg": 1}, True, None, id="firstresult_no_match"
+        ),
+        # Zuordnung über Parameternamen, überflüssige kwargs werden ignoriert.
+        pytest.param(
+            [_hook_sum],
+            {"x": 10, "y": 20, "unused": 999},
+            False,
+            [30],
+            id="argument_mapping",
+        ),
+    ],
+)
+def test_multicall_behavior(hooks, kwargs, firstresult, expected):
+    """
+    Verifiziert: Ergebnis-Sammlung, firstresult und Argument-Zuordnung
+    von _multicall für einfache (Nicht-Wrapper-)Implementierungen.
+    """
+    impls = [create_impl(hook) for hook in hooks]
+
+    res = _multicall("test_hook", impls, kwargs, firstresult=firstresult)
+
+    assert res == expected
+
+@pytest.mark.parametrize(
+    ("hook", "kwargs", "exc", "match"),
+    [
+        # Fehlendes Pflichtargument -> HookCallError.
+        pytest.param(
+            _hook_required,
+            {"wrong_arg": 1},
+            HookCallError,
+            "must provide argument 'required_arg'",
+            id="missing_argument",
+        ),
+        # Crasht ein Hook, muss die Exception nach außen dringen.
+        pytest.param(
+            _hook_crash, {"arg": 1}, ValueError, "Crash!", id="exception_propagates"
+        ),
+    ],
+)
+def test_multicall_raises(hook, kwargs, exc, match):
+    """
+    Verifiziert: Error Handling / Exception Propagation
+    """
+    with pytest.raises(exc, match=match):
+        _multicall("test_hook", [create_impl(hook)], kwargs, firstresult=False)
 
 def test_multicall_wrappers_execution_order():
     """
@@ -234,19 +205,6 @@ def test_multicall_wrappers_modify_result():
     
     assert res == ["overwritten"]
 
-def test_multicall_exception_handling():
-    """
-    Verifiziert: Exception Propagation
-    - Wenn ein Hook crasht, muss die Exception nach außen dringen.
-    """
-    def impl_crash(arg):
-        raise ValueError("Crash!")
-
-    impls = [create_impl(impl_crash)]
-    
-    with pytest.raises(ValueError, match="Crash!"):
-        _multicall("test_hook", impls, {"arg": 1}, firstresult=False)
-
 def test_multicall_wrapper_exception_handling():
     """
     FIXED: Pluggy Wrappers fangen Exceptions nicht mit try/except um das yield,
@@ -261,13 +219,10 @@ def test_multicall_wrapper_exception_handling():
             # Wir machen nichts weiter, d.h. die Exception bleibt im Result 
             # und wird am Ende von _multicall geworfen.
 
-    def impl_crash(arg):
-        raise ValueError("Boom")
-
-    impls = [create_impl(impl_crash), create_impl(wrapper_check_exception, hookwrapper=True)]
+    impls = [create_impl(_hook_crash), create_impl(wrapper_check_exception, hookwrapper=True)]
     
     # Die Exception muss trotzdem aus _multicall herauskommen
-    with pytest.raises(ValueError, match="Boom"):
+    with pytest.raises(ValueError, match="Crash!"):
         _multicall("test_hook", impls, {"arg": 1}, firstresult=False)
     
     assert log == ["caught"]
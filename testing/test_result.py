@@ -25,3 +25,17 @@ def test_exceptions_traceback_doesnt_get_longer_and_longer() -> None:
         tb3 = traceback.extract_tb(exc.__traceback__)
 
     assert len(tb1) == len(tb2) == len(tb3)
+
+
+def test_fast_constructors_match_init() -> None:
+    ok = Result._ok(3)
+    assert ok.get_result() == 3
+    assert ok.excinfo is None
+
+    try:
+        1 / 0
+    except ZeroDivisionError as e:
+        exc = e
+    err: Result[None] = Result._err(exc)
+    assert err.excinfo == Result(None, exc).excinfo
+    assert err.excinfo == (ZeroDivisionError, exc, exc.__traceback__)